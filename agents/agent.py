@@ -16,6 +16,19 @@ from mcp_server.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Stream indicators, matched in a single pass over the lowered query
+_STREAM_PATTERN = re.compile("real-time|realtime|stream|live|continuous|subscribe")
+
+# Symbol patterns, tried in order against the uppercased query
+_SYMBOL_PATTERNS = (
+    re.compile(r'\b([A-Z]{1,5})\b'),  # Stock symbols like AAPL, MSFT
+    re.compile(r'\b([A-Z]{2,}USDT?)\b'),  # Crypto like BTCUSDT, ETHUSDT
+    re.compile(r'symbol[:\s]+([A-Za-z0-9]+)'),  # Explicit symbol mention
+)
+
+# Common words that look like symbols
+_COMMON_WORDS = frozenset({"THE", "FOR", "AND", "GET", "SHOW", "WHAT", "PRICE", "OF", "IS"})
+
 
 class MCPFinanceAgent:
     """
@@ -63,34 +76,22 @@ class MCPFinanceAgent:
         - "real-time", "stream", "live" -> quote.stream
         - "last X minutes", "latest", "current", "price" -> quote.latest
         """
-        query_lower = query.lower()
-        
         # Stream indicators
-        stream_patterns = ["real-time", "realtime", "stream", "live", "continuous", "subscribe"]
-        for pattern in stream_patterns:
-            if pattern in query_lower:
-                return "quote.stream"
+        if _STREAM_PATTERN.search(query.lower()):
+            return "quote.stream"
         
         # Latest indicators (default)
         return "quote.latest"
     
     def extract_symbol(self, query: str) -> Optional[str]:
         """Extract symbol from query"""
-        # Common patterns
-        patterns = [
-            r'\b([A-Z]{1,5})\b',  # Stock symbols like AAPL, MSFT
-            r'\b([A-Z]{2,}USDT?)\b',  # Crypto like BTCUSDT, ETHUSDT
-            r'symbol[:\s]+([A-Za-z0-9]+)',  # Explicit symbol mention
-        ]
+        query_upper = query.upper()
         
-        for pattern in patterns:
-            matches = re.findall(pattern, query.upper())
-            if matches:
+        for pattern in _SYMBOL_PATTERNS:
+            for match in pattern.findall(query_upper):
                 # Filter out common words
-                common_words = {"THE", "FOR", "AND", "GET", "SHOW", "WHAT", "PRICE", "OF", "IS"}
-                for match in matches:
-                    if match not in common_words:
-                        return match
+                if match not in _COMMON_WORDS:
+                    return match
         
         return None
     
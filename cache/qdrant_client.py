@@ -2,12 +2,16 @@
 Qdrant Client for Semantic Cache
 """
 import uuid
+import asyncio
+import hashlib
+import threading
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from qdrant_client import QdrantClient as QdrantClientLib
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, Range
 from sentence_transformers import SentenceTransformer
+from cachetools import LRUCache
 from mcp_server.config import get_settings
 from mcp_server.utils.logging import get_logger
 
@@ -19,6 +23,15 @@ class SemanticCacheClient:
     
     EMBEDDING_MODEL = "all-MiniLM-L6-v2"
     VECTOR_SIZE = 384
+    EMBEDDING_CACHE_SIZE = 4096
+    
+    # Search the binary-quantized index, then rescore candidates with original vectors
+    SEARCH_PARAMS = models.SearchParams(
+        quantization=models.QuantizationSearchParams(
+            rescore=True,
+            oversampling=2.0
+        )
+    )
     
     def __init__(self):
         settings = get_settings()
@@ -28,16 +41,23 @@ class SemanticCacheClient:
         )
         self._collection_name = settings.qdrant_collection
         self._model: Optional[SentenceTransformer] = None
+        self._model_lock = threading.Lock()
         self._threshold = settings.semantic_cache_threshold
         self._recency_minutes = settings.semantic_cache_recency_minutes
         self._initialized = False
+        # Embeddings keyed by a digest of the query text, so repeat queries
+        # (and the search-then-store pair on a miss) reuse one encode
+        self._embeddings: LRUCache = LRUCache(maxsize=self.EMBEDDING_CACHE_SIZE)
+        self._embeddings_lock = threading.Lock()
     
     def _get_model(self) -> SentenceTransformer:
-        """Lazy load the sentence transformer model"""
+        """Lazy load the sentence transformer model; safe to call from worker threads"""
         if self._model is None:
-            logger.info("loading_embedding_model", model=self.EMBEDDING_MODEL)
-            self._model = SentenceTransformer(self.EMBEDDING_MODEL)
-            logger.info("embedding_model_loaded")
+            with self._model_lock:
+                if self._model is None:
+                    logger.info("loading_embedding_model", model=self.EMBEDDING_MODEL)
+                    self._model = SentenceTransformer(self.EMBEDDING_MODEL)
+                    logger.info("embedding_model_loaded")
         return self._model
     
     def initialize(self) -> bool:
@@ -51,7 +71,12 @@ class SemanticCacheClient:
                     collection_name=self._collection_name,
                     vectors_config=VectorParams(
                         size=self.VECTOR_SIZE,
-                        distance=Distance.COSINE
+                        distance=Distance.COSINE,
+                        on_disk=True  # Originals only needed for rescoring
+                    ),
+                    # 1-bit vectors kept in RAM for the coarse similarity pass
+                    quantization_config=models.BinaryQuantization(
+                        binary=models.BinaryQuantizationConfig(always_ram=True)
                     )
                 )
                 logger.info("collection_created", name=self._collection_name)
@@ -66,10 +91,20 @@ class SemanticCacheClient:
             return False
     
     def embed_text(self, text: str) -> List[float]:
-        """Generate embedding for text"""
+        """Generate embedding for text, reusing cached vectors for repeat text"""
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        
+        with self._embeddings_lock:
+            cached = self._embeddings.get(key)
+        if cached is not None:
+            return list(cached)
+        
         model = self._get_model()
-        embedding = model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        embedding = tuple(model.encode(text, convert_to_numpy=True).tolist())
+        
+        with self._embeddings_lock:
+            self._embeddings[key] = embedding
+        return list(embedding)
     
     def search_similar(
         self,
@@ -116,7 +151,8 @@ class SemanticCacheClient:
                 query_vector=query_vector,
                 query_filter=Filter(must=must_conditions) if must_conditions else None,
                 limit=limit,
-                score_threshold=self._threshold
+                score_threshold=self._threshold,
+                search_params=self.SEARCH_PARAMS
             )
             
             if not results:
@@ -144,6 +180,22 @@ class SemanticCacheClient:
             logger.error("semantic_search_error", error=str(e))
             return None
     
+    async def search_similar_async(
+        self,
+        query_text: str,
+        symbol: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 1
+    ) -> Optional[Dict[str, Any]]:
+        """Search the semantic cache without blocking the event loop"""
+        return await asyncio.to_thread(
+            self.search_similar,
+            query_text=query_text,
+            symbol=symbol,
+            agent_id=agent_id,
+            limit=limit
+        )
+    
     def store_response(
         self,
         agent_id: str,
@@ -189,6 +241,22 @@ class SemanticCacheClient:
             logger.error("semantic_store_error", error=str(e))
             return False
     
+    async def store_response_async(
+        self,
+        agent_id: str,
+        symbol: str,
+        query_text: str,
+        response_text: str
+    ) -> bool:
+        """Store a response without blocking the event loop"""
+        return await asyncio.to_thread(
+            self.store_response,
+            agent_id=agent_id,
+            symbol=symbol,
+            query_text=query_text,
+            response_text=response_text
+        )
+    
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get collection statistics"""
         try:
@@ -2,6 +2,7 @@
 Redis Client for Hot Cache and Streams
 """
 import redis
+import redis.asyncio as aioredis
 import json
 import time
 from typing import Optional, Dict, Any, List
@@ -18,6 +19,8 @@ class RedisClient:
     
     SNAPSHOT_PREFIX = "snapshot:"
     STREAM_PREFIX = "stream:"
+    STREAM_MAXLEN = 10000
+    ASYNC_MAX_CONNECTIONS = 50
     
     def __init__(self):
         settings = get_settings()
@@ -27,6 +30,15 @@ class RedisClient:
             db=settings.redis_db,
             decode_responses=True
         )
+        # Pooled asyncio client for request handlers; the sync client stays
+        # for connector threads and startup checks
+        self._async_client = aioredis.Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            decode_responses=True,
+            max_connections=self.ASYNC_MAX_CONNECTIONS
+        )
         self._connected = False
     
     def connect(self) -> bool:
@@ -52,6 +64,23 @@ class RedisClient:
             self._connected = False
             return False
     
+    async def is_connected_async(self) -> bool:
+        """Check if connected to Redis without blocking the event loop"""
+        try:
+            await self._async_client.ping()
+            self._connected = True
+            return True
+        except redis.ConnectionError:
+            self._connected = False
+            return False
+    
+    def pipeline(self, transaction: bool = False) -> redis.client.Pipeline:
+        """
+        Get a pipeline for batching commands into a single round-trip
+        Non-transactional by default (no MULTI/EXEC)
+        """
+        return self._client.pipeline(transaction=transaction)
+    
     # ==================== SNAPSHOT OPERATIONS ====================
     
     def get_snapshot(self, symbol: str) -> Optional[QuoteData]:
@@ -68,40 +97,96 @@ class RedisClient:
                 logger.debug("snapshot_miss", symbol=symbol)
                 return None
             
-            quote = QuoteData(
-                symbol=data.get("symbol", symbol),
-                price=float(data.get("price", 0)),
-                timestamp=datetime.fromisoformat(data.get("timestamp", datetime.utcnow().isoformat())),
-                data_source=DataSource(data.get("source", "redis_cache")),
-                cache_hit=True,
-                latency_ms=float(data.get("latency_ms", 0)),
-                volume=float(data["volume"]) if data.get("volume") else None
-            )
+            quote = self._parse_snapshot(data, symbol)
             
-            logger.debug("snapshot_hit", symbol=symbol, age_sec=self._get_snapshot_age(symbol))
+            logger.debug("snapshot_hit", symbol=symbol, age_sec=self._age_sec(quote.timestamp))
             return quote
             
         except Exception as e:
             logger.error("snapshot_get_error", symbol=symbol, error=str(e))
             return None
     
+    async def get_snapshot_if_fresh_async(self, symbol: str, max_age_sec: int) -> Optional[QuoteData]:
+        """
+        Get cached snapshot only if it is younger than max_age_sec
+        Single HGETALL; freshness is checked client-side
+        Raises redis.RedisError if Redis is unreachable, so callers can tell an outage from a miss
+        """
+        key = f"{self.SNAPSHOT_PREFIX}{symbol.upper()}"
+        data = await self._async_client.hgetall(key)
+        
+        if not data or "timestamp" not in data:
+            logger.debug("snapshot_miss", symbol=symbol)
+            return None
+        
+        try:
+            quote = self._parse_snapshot(data, symbol)
+            age = self._age_sec(quote.timestamp)
+            
+            if age >= max_age_sec:
+                logger.debug("snapshot_stale", symbol=symbol, age_sec=age)
+                return None
+            
+            logger.debug("snapshot_hit", symbol=symbol, age_sec=age)
+            return quote
+            
+        except Exception as e:
+            logger.error("snapshot_parse_error", symbol=symbol, error=str(e))
+            return None
+    
+    @staticmethod
+    def _parse_snapshot(data: Dict[str, str], symbol: str) -> QuoteData:
+        """Build a QuoteData from snapshot hash fields"""
+        return QuoteData(
+            symbol=data.get("symbol", symbol),
+            price=float(data.get("price", 0)),
+            timestamp=datetime.fromisoformat(data.get("timestamp", datetime.utcnow().isoformat())),
+            data_source=DataSource(data.get("source", "redis_cache")),
+            cache_hit=True,
+            latency_ms=float(data.get("latency_ms", 0)),
+            volume=float(data["volume"]) if data.get("volume") else None
+        )
+    
+    @staticmethod
+    def _age_sec(timestamp: datetime) -> float:
+        """Seconds elapsed since a snapshot timestamp"""
+        return (datetime.utcnow() - timestamp).total_seconds()
+    
     def set_snapshot(self, quote: QuoteData) -> bool:
         """Store snapshot for a symbol"""
         key = f"{self.SNAPSHOT_PREFIX}{quote.symbol.upper()}"
         
         try:
-            data = {
-                "symbol": quote.symbol,
-                "price": str(quote.price),
-                "timestamp": quote.timestamp.isoformat(),
-                "source": quote.data_source.value,
-                "latency_ms": str(quote.latency_ms)
-            }
-            
-            if quote.volume is not None:
-                data["volume"] = str(quote.volume)
-            
-            self._client.hset(key, mapping=data)
+            self._client.hset(key, mapping=self._snapshot_fields(quote))
+            logger.info("snapshot_set", symbol=quote.symbol, price=quote.price)
+            return True
+            
+        except Exception as e:
+            logger.error("snapshot_set_error", symbol=quote.symbol, error=str(e))
+            return False
+    
+    @staticmethod
+    def _snapshot_fields(quote: QuoteData) -> Dict[str, str]:
+        """Hash fields stored for a snapshot"""
+        data = {
+            "symbol": quote.symbol,
+            "price": str(quote.price),
+            "timestamp": quote.timestamp.isoformat(),
+            "source": quote.data_source.value,
+            "latency_ms": str(quote.latency_ms)
+        }
+        
+        if quote.volume is not None:
+            data["volume"] = str(quote.volume)
+        
+        return data
+    
+    async def set_snapshot_async(self, quote: QuoteData) -> bool:
+        """Store snapshot without blocking the event loop"""
+        key = f"{self.SNAPSHOT_PREFIX}{quote.symbol.upper()}"
+        
+        try:
+            await self._async_client.hset(key, mapping=self._snapshot_fields(quote))
             logger.info("snapshot_set", symbol=quote.symbol, price=quote.price)
             return True
             
@@ -147,18 +232,7 @@ class RedisClient:
         key = f"{self.STREAM_PREFIX}{tick.symbol.upper()}"
         
         try:
-            entry = {
-                "symbol": tick.symbol,
-                "price": str(tick.price),
-                "volume": str(tick.volume),
-                "ts": tick.timestamp.isoformat(),
-                "source": tick.data_source.value
-            }
-            
-            if tick.trade_id:
-                entry["trade_id"] = tick.trade_id
-            
-            entry_id = self._client.xadd(key, entry, maxlen=10000)
+            entry_id = self._client.xadd(key, self._stream_entry(tick), maxlen=self.STREAM_MAXLEN)
             logger.debug("stream_add", symbol=tick.symbol, entry_id=entry_id)
             return entry_id
             
@@ -166,6 +240,45 @@ class RedisClient:
             logger.error("stream_add_error", symbol=tick.symbol, error=str(e))
             return None
     
+    def add_tick(self, tick: StreamTick, quote: QuoteData) -> Optional[str]:
+        """
+        Append a tick to its stream and update the symbol snapshot
+        in one pipelined round-trip
+        Returns stream entry ID or None on failure
+        """
+        try:
+            pipe = self.pipeline()
+            pipe.xadd(
+                f"{self.STREAM_PREFIX}{tick.symbol.upper()}",
+                self._stream_entry(tick),
+                maxlen=self.STREAM_MAXLEN
+            )
+            pipe.hset(f"{self.SNAPSHOT_PREFIX}{quote.symbol.upper()}", mapping=self._snapshot_fields(quote))
+            entry_id, _ = pipe.execute()
+            
+            logger.debug("tick_added", symbol=tick.symbol, entry_id=entry_id)
+            return entry_id
+            
+        except Exception as e:
+            logger.error("tick_add_error", symbol=tick.symbol, error=str(e))
+            return None
+    
+    @staticmethod
+    def _stream_entry(tick: StreamTick) -> Dict[str, str]:
+        """Stream entry fields stored for a tick"""
+        entry = {
+            "symbol": tick.symbol,
+            "price": str(tick.price),
+            "volume": str(tick.volume),
+            "ts": tick.timestamp.isoformat(),
+            "source": tick.data_source.value
+        }
+        
+        if tick.trade_id:
+            entry["trade_id"] = tick.trade_id
+        
+        return entry
+    
     def read_stream(self, symbol: str, count: int = 100, last_id: str = "0") -> List[StreamTick]:
         """Read entries from stream"""
         key = f"{self.STREAM_PREFIX}{symbol.upper()}"
@@ -233,6 +346,14 @@ class RedisClient:
             logger.info("redis_disconnected")
         except Exception as e:
             logger.error("redis_close_error", error=str(e))
+    
+    async def close_async(self):
+        """Close both the sync and asyncio connection pools"""
+        self.close()
+        try:
+            await self._async_client.aclose()
+        except Exception as e:
+            logger.error("redis_close_error", error=str(e))
 
 
 # Singleton instance
@@ -4,6 +4,7 @@ Free tier - rate limited to 5 calls/minute
 """
 import httpx
 import time
+import msgspec
 from typing import Optional
 from datetime import datetime
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -19,6 +20,35 @@ class RateLimitError(Exception):
     pass
 
 
+class _GlobalQuote(msgspec.Struct):
+    """
+    GLOBAL_QUOTE fields we use, keyed by Alpha Vantage's numbered names
+    Numbers stay strings here: Alpha Vantage sends "" for missing values
+    """
+    symbol: Optional[str] = msgspec.field(default=None, name="01. symbol")
+    open: Optional[str] = msgspec.field(default=None, name="02. open")
+    high: Optional[str] = msgspec.field(default=None, name="03. high")
+    low: Optional[str] = msgspec.field(default=None, name="04. low")
+    price: Optional[str] = msgspec.field(default=None, name="05. price")
+    volume: Optional[str] = msgspec.field(default=None, name="06. volume")
+    previous_close: Optional[str] = msgspec.field(default=None, name="08. previous close")
+
+
+class _GlobalQuoteResponse(msgspec.Struct):
+    """GLOBAL_QUOTE response envelope, including rate limit and error messages"""
+    global_quote: Optional[_GlobalQuote] = msgspec.field(default=None, name="Global Quote")
+    note: Optional[str] = msgspec.field(default=None, name="Note")
+    error_message: Optional[str] = msgspec.field(default=None, name="Error Message")
+
+
+_decode_global_quote = msgspec.json.Decoder(_GlobalQuoteResponse).decode
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    """Convert an Alpha Vantage numeric string, treating missing or blank as None"""
+    return float(value) if value else None
+
+
 class AlphaVantageConnector:
     """
     Alpha Vantage REST API connector
@@ -38,6 +68,16 @@ class AlphaVantageConnector:
         """Close the HTTP client"""
         await self._client.aclose()
     
+    async def warm_up(self) -> bool:
+        """Open a pooled connection with a HEAD request (no API quota used)"""
+        try:
+            await self._client.head(self.BASE_URL, timeout=5.0)
+            logger.info("alpha_vantage_connection_warmed")
+            return True
+        except httpx.HTTPError as e:
+            logger.warning("alpha_vantage_warm_up_failed", error=str(e))
+            return False
+    
     def _respect_rate_limit(self):
         """Ensure minimum interval between calls"""
         elapsed = time.time() - self._last_call_time
@@ -72,21 +112,22 @@ class AlphaVantageConnector:
             response = await self._client.get(self.BASE_URL, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = _decode_global_quote(response.content)
             
             # Check for rate limit or error messages
-            if "Note" in data:
-                logger.warning("alpha_vantage_rate_limit", message=data["Note"])
-                raise RateLimitError(data["Note"])
+            if data.note:
+                logger.warning("alpha_vantage_rate_limit", message=data.note)
+                raise RateLimitError(data.note)
             
-            if "Error Message" in data:
-                logger.error("alpha_vantage_error", message=data["Error Message"])
+            if data.error_message:
+                logger.error("alpha_vantage_error", message=data.error_message)
                 return None
             
             # Parse Global Quote response
-            quote_data = data.get("Global Quote", {})
+            quote_data = data.global_quote
             
-            if not quote_data:
+            price = _to_float(quote_data.price) if quote_data is not None else None
+            if price is None:
                 logger.warning("alpha_vantage_empty_response", symbol=symbol)
                 return None
             
@@ -94,17 +135,17 @@ class AlphaVantageConnector:
             
             # Normalize to unified schema
             quote = QuoteData(
-                symbol=quote_data.get("01. symbol", symbol).upper(),
-                price=float(quote_data.get("05. price", 0)),
+                symbol=(quote_data.symbol or symbol).upper(),
+                price=price,
                 timestamp=datetime.utcnow(),
                 data_source=DataSource.ALPHA_VANTAGE,
                 cache_hit=False,
                 latency_ms=latency_ms,
-                volume=float(quote_data.get("06. volume", 0)) if quote_data.get("06. volume") else None,
-                high=float(quote_data.get("03. high", 0)) if quote_data.get("03. high") else None,
-                low=float(quote_data.get("04. low", 0)) if quote_data.get("04. low") else None,
-                open=float(quote_data.get("02. open", 0)) if quote_data.get("02. open") else None,
-                previous_close=float(quote_data.get("08. previous close", 0)) if quote_data.get("08. previous close") else None
+                volume=_to_float(quote_data.volume),
+                high=_to_float(quote_data.high),
+                low=_to_float(quote_data.low),
+                open=_to_float(quote_data.open),
+                previous_close=_to_float(quote_data.previous_close)
             )
             
             logger.info(
@@ -3,8 +3,8 @@ Binance WebSocket Connector
 Free real-time crypto trades streaming
 """
 import asyncio
-import json
 import uuid
+import msgspec
 from typing import Optional, Dict, Callable, Set
 from datetime import datetime
 import websockets
@@ -16,12 +16,31 @@ from cache.redis_client import get_redis_client
 logger = get_logger(__name__)
 
 
+class _TradeMessage(msgspec.Struct):
+    """
+    Binance trade message fields we use
+    {e: "trade", E: timestamp, s: symbol, p: price, q: quantity, t: trade_id, ...}
+    """
+    e: str = ""
+    E: int = 0
+    s: Optional[str] = None
+    p: float = 0.0
+    q: float = 0.0
+    t: Optional[int] = None
+
+
+# Non-strict so numeric strings ("50000.01") decode straight to floats
+_decode_message = msgspec.json.Decoder(_TradeMessage, strict=False).decode
+
+
 class BinanceWebSocketConnector:
     """
     Binance WebSocket connector for real-time crypto trades
     Stream format: wss://stream.binance.com:9443/ws/{symbol}@trade
     """
     
+    TICK_QUEUE_MAXSIZE = 1000
+    
     def __init__(self):
         settings = get_settings()
         self._base_url = settings.binance_ws_url
@@ -30,6 +49,7 @@ class BinanceWebSocketConnector:
         self._callbacks: Dict[str, Callable] = {}  # subscription_id -> callback
         self._running: Set[str] = set()
         self._tasks: Dict[str, asyncio.Task] = {}
+        self._tick_queues: Dict[str, asyncio.Queue] = {}  # subscription_id -> raw ticks
         self._redis = get_redis_client()
     
     def _get_stream_url(self, symbol: str, channel: str = "trade") -> str:
@@ -62,6 +82,7 @@ class BinanceWebSocketConnector:
             
             # Store subscription info
             self._subscriptions[subscription_id] = symbol_upper
+            self._tick_queues[subscription_id] = asyncio.Queue(maxsize=self.TICK_QUEUE_MAXSIZE)
             if callback:
                 self._callbacks[subscription_id] = callback
             
@@ -106,6 +127,11 @@ class BinanceWebSocketConnector:
             symbol = self._subscriptions.pop(subscription_id, None)
             self._callbacks.pop(subscription_id, None)
             
+            # Wake any stream consumer so it can close
+            tick_queue = self._tick_queues.pop(subscription_id, None)
+            if tick_queue is not None:
+                self._put_latest(tick_queue, None)
+            
             logger.info(
                 "binance_unsubscribed",
                 subscription_id=subscription_id,
@@ -167,24 +193,30 @@ class BinanceWebSocketConnector:
     async def _process_message(self, subscription_id: str, message: str, symbol: str):
         """Process incoming WebSocket message"""
         try:
-            data = json.loads(message)
+            data = _decode_message(message)
             
-            # Parse Binance trade message format
-            # {e: "trade", E: timestamp, s: symbol, p: price, q: quantity, t: trade_id, ...}
-            if data.get("e") == "trade":
+            if data.e == "trade":
+                tick_symbol = (data.s or symbol).upper()
+                price = data.p
+                volume = data.q
+                event_time_ms = data.E
+                trade_id = str(data.t)
+                
+                # Raw tuple for /stream consumers: (symbol, price, volume, ts_ms, trade_id)
+                tick_queue = self._tick_queues.get(subscription_id)
+                if tick_queue is not None:
+                    self._put_latest(tick_queue, (tick_symbol, price, volume, event_time_ms, trade_id))
+                
                 tick = StreamTick(
-                    symbol=data.get("s", symbol).upper(),
-                    price=float(data.get("p", 0)),
-                    volume=float(data.get("q", 0)),
-                    timestamp=datetime.fromtimestamp(data.get("E", 0) / 1000),
-                    trade_id=str(data.get("t")),
+                    symbol=tick_symbol,
+                    price=price,
+                    volume=volume,
+                    timestamp=datetime.fromtimestamp(event_time_ms / 1000),
+                    trade_id=trade_id,
                     data_source=DataSource.BINANCE
                 )
                 
-                # Push to Redis stream
-                self._redis.add_to_stream(tick)
-                
-                # Update snapshot
+                # Push to Redis stream and update snapshot in one round-trip
                 from mcp_server.schemas import QuoteData
                 quote = QuoteData(
                     symbol=tick.symbol,
@@ -193,7 +225,7 @@ class BinanceWebSocketConnector:
                     data_source=DataSource.BINANCE,
                     volume=tick.volume
                 )
-                self._redis.set_snapshot(quote)
+                self._redis.add_tick(tick, quote)
                 
                 # Call callback if registered
                 if subscription_id in self._callbacks:
@@ -206,11 +238,25 @@ class BinanceWebSocketConnector:
                     volume=tick.volume
                 )
                 
-        except json.JSONDecodeError as e:
+        except msgspec.DecodeError as e:
             logger.error("binance_json_error", error=str(e))
         except Exception as e:
             logger.error("binance_process_error", error=str(e))
     
+    @staticmethod
+    def _put_latest(queue: asyncio.Queue, item) -> None:
+        """Enqueue without blocking, dropping the oldest item when full"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
+    
+    def get_tick_queue(self, subscription_id: str) -> Optional[asyncio.Queue]:
+        """
+        Get the raw tick queue for a subscription
+        Items are (symbol, price, volume, ts_ms, trade_id) tuples; None means unsubscribed
+        """
+        return self._tick_queues.get(subscription_id)
+    
     async def get_latest_price(self, symbol: str) -> Optional[StreamTick]:
         """Get the latest price from Redis stream (if available)"""
         return self._redis.get_latest_from_stream(symbol)
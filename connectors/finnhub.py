@@ -4,6 +4,7 @@ Free tier - 60 API calls/minute
 """
 import httpx
 import time
+import msgspec
 from typing import Optional
 from datetime import datetime
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -19,6 +20,18 @@ class RateLimitError(Exception):
     pass
 
 
+class _FinnhubQuote(msgspec.Struct):
+    """/quote response: c=current, h=high, l=low, o=open, pc=previous close"""
+    c: Optional[float] = None
+    h: Optional[float] = None
+    l: Optional[float] = None
+    o: Optional[float] = None
+    pc: Optional[float] = None
+
+
+_decode_quote = msgspec.json.Decoder(_FinnhubQuote).decode
+
+
 class FinnhubConnector:
     """
     Finnhub REST API connector
@@ -38,6 +51,16 @@ class FinnhubConnector:
         """Close the HTTP client"""
         await self._client.aclose()
     
+    async def warm_up(self) -> bool:
+        """Open a pooled connection with a HEAD request (no API quota used)"""
+        try:
+            await self._client.head(self.BASE_URL, timeout=5.0)
+            logger.info("finnhub_connection_warmed")
+            return True
+        except httpx.HTTPError as e:
+            logger.warning("finnhub_warm_up_failed", error=str(e))
+            return False
+    
     def _respect_rate_limit(self):
         """Ensure minimum interval between calls"""
         elapsed = time.time() - self._last_call_time
@@ -78,28 +101,27 @@ class FinnhubConnector:
                 raise RateLimitError("Rate limit exceeded")
             
             response.raise_for_status()
-            data = response.json()
+            data = _decode_quote(response.content)
             
             # Check for empty response
-            if not data or data.get("c") == 0:
+            if not data.c:
                 logger.warning("finnhub_empty_response", symbol=symbol)
                 return None
             
             latency_ms = (time.time() - start_time) * 1000
             
-            # Normalize to unified schema
-            # Finnhub response: c=current, h=high, l=low, o=open, pc=previous close, t=timestamp
+            # Normalize to unified schema; zero means "no data" for the other fields
             quote = QuoteData(
                 symbol=symbol.upper(),
-                price=float(data.get("c", 0)),
+                price=data.c,
                 timestamp=datetime.utcnow(),
                 data_source=DataSource.FINNHUB,
                 cache_hit=False,
                 latency_ms=latency_ms,
-                high=float(data.get("h", 0)) if data.get("h") else None,
-                low=float(data.get("l", 0)) if data.get("l") else None,
-                open=float(data.get("o", 0)) if data.get("o") else None,
-                previous_close=float(data.get("pc", 0)) if data.get("pc") else None
+                high=data.h or None,
+                low=data.l or None,
+                open=data.o or None,
+                previous_close=data.pc or None
             )
             
             logger.info(
@@ -2,8 +2,9 @@
 Lineage Writer for Neo4j
 Records all data lineage and relationships during MCP operations
 """
+import asyncio
 import uuid
-from typing import Optional
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 from graph.neo4j_client import get_neo4j_client
 from mcp_server.utils.logging import get_logger
@@ -11,13 +12,33 @@ from mcp_server.schemas import QuoteData, StreamTick, DataSource
 
 logger = get_logger(__name__)
 
+# Endpoint that emitted a quote, by data source
+QUOTE_ENDPOINTS = {
+    DataSource.ALPHA_VANTAGE: "av_quote",
+    DataSource.FINNHUB: "fh_quote",
+    DataSource.BINANCE: "bn_trade_stream",
+    DataSource.REDIS_CACHE: "mcp_quote_latest",
+    DataSource.LOCAL_CACHE: "mcp_quote_latest",
+    DataSource.SEMANTIC_CACHE: "mcp_quote_latest"
+}
+
+# Sources that map to an external API node; everything else is mcp_server
+EXTERNAL_SOURCES = {DataSource.ALPHA_VANTAGE, DataSource.FINNHUB, DataSource.BINANCE}
+
 
 class LineageWriter:
     """Writes lineage information to Neo4j graph database"""
     
+    QUEUE_MAXSIZE = 10_000
+    BATCH_SIZE = 500
+    FLUSH_INTERVAL_SEC = 0.05
+    SHUTDOWN_TIMEOUT_SEC = 5.0
+    
     def __init__(self):
         self._client = get_neo4j_client()
         self._initialized = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_MAXSIZE)
+        self._stopping = False
     
     def initialize(self) -> bool:
         """Initialize the lineage writer and create base nodes"""
@@ -87,7 +108,15 @@ class LineageWriter:
             logger.error("lineage_init_error", error=str(e))
             return False
     
-    def record_agent_call(
+    async def warm_up(self) -> bool:
+        """Open the async Neo4j connection used by request-path writes"""
+        return await self._client.warm_up()
+    
+    async def close(self):
+        """Close the underlying Neo4j drivers"""
+        await self._client.close_async()
+    
+    async def record_agent_call(
         self,
         agent_id: str,
         api_name: str,
@@ -98,41 +127,24 @@ class LineageWriter:
         query_text: Optional[str] = None
     ) -> bool:
         """Record an agent's call to an API"""
-        try:
-            # Ensure agent exists
-            self._client.create_agent_node(agent_id=agent_id)
-            
-            # Ensure instrument exists
-            self._client.create_instrument_node(symbol=symbol)
-            
-            # Create query node if query text provided
-            if query_text:
-                query_id = f"q_{uuid.uuid4().hex[:8]}"
-                self._client.create_query_node(
-                    query_id=query_id,
-                    query_text=query_text,
-                    tool_name=tool_name
-                )
-            
-            # Create CALLS edge
-            self._client.create_calls_edge(
-                agent_id=agent_id,
-                api_name=api_name,
-                latency_ms=latency_ms,
-                response_code=response_code
-            )
-            
+        recorded = await self._client.create_agent_call(
+            agent_id=agent_id,
+            api_name=api_name,
+            latency_ms=latency_ms,
+            response_code=response_code,
+            symbol=symbol,
+            tool_name=tool_name,
+            query_text=query_text
+        )
+        
+        if recorded:
             logger.info(
                 "lineage_call_recorded",
                 agent=agent_id,
                 api=api_name,
                 symbol=symbol
             )
-            return True
-            
-        except Exception as e:
-            logger.error("record_call_error", error=str(e))
-            return False
+        return recorded
     
     def record_tick_event(
         self,
@@ -167,64 +179,101 @@ class LineageWriter:
             logger.error("record_tick_error", error=str(e))
             return False
     
-    def record_quote_fetch(
+    # ==================== BATCHED QUOTE LINEAGE ====================
+    
+    def enqueue_quote_fetch(
         self,
         quote: QuoteData,
         agent_id: Optional[str] = None
     ) -> bool:
-        """Record a quote fetch event"""
+        """
+        Queue a quote fetch for the background batch writer
+        Never blocks; drops the record if Neo4j isn't initialized or the queue is full
+        """
+        if not self._initialized:
+            return False
+        
         try:
-            # Ensure instrument exists
-            instrument_type = "crypto" if "USDT" in quote.symbol else "stock"
-            self._client.create_instrument_node(
-                symbol=quote.symbol,
-                instrument_type=instrument_type
-            )
-            
-            # Create event for the quote
-            event_id = f"quote_{uuid.uuid4().hex[:8]}"
-            self._client.create_event_node(
-                event_id=event_id,
-                event_type="quote",
-                symbol=quote.symbol,
-                price=quote.price,
-                timestamp=quote.timestamp
-            )
-            
-            # Determine endpoint based on source
-            endpoint_map = {
-                DataSource.ALPHA_VANTAGE: "av_quote",
-                DataSource.FINNHUB: "fh_quote",
-                DataSource.BINANCE: "bn_trade_stream",
-                DataSource.REDIS_CACHE: "mcp_quote_latest",
-                DataSource.SEMANTIC_CACHE: "mcp_quote_latest"
-            }
-            endpoint_id = endpoint_map.get(quote.data_source, "mcp_quote_latest")
+            self._queue.put_nowait(self._quote_row(quote, agent_id))
+            return True
+        except asyncio.QueueFull:
+            logger.warning("lineage_queue_full", symbol=quote.symbol)
+            return False
+    
+    async def run_batch_consumer(self):
+        """
+        Drain the lineage queue until stop() is called, writing up to BATCH_SIZE
+        records per Neo4j round-trip at most every FLUSH_INTERVAL_SEC
+        """
+        loop = asyncio.get_running_loop()
+        
+        while not self._stopping:
+            row = await self._queue.get()
+            if row is None:
+                break
             
-            self._client.create_emits_edge(
-                endpoint_id=endpoint_id,
-                event_id=event_id
-            )
+            batch = [row]
+            deadline = loop.time() + self.FLUSH_INTERVAL_SEC
             
-            # If agent provided, record the call
-            if agent_id:
-                api_name = quote.data_source.value if quote.data_source in [
-                    DataSource.ALPHA_VANTAGE, DataSource.FINNHUB, DataSource.BINANCE
-                ] else "mcp_server"
-                
-                self._client.create_calls_edge(
-                    agent_id=agent_id,
-                    api_name=api_name,
-                    latency_ms=quote.latency_ms,
-                    response_code=200
-                )
+            while len(batch) < self.BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    break
+                batch.append(row)
             
-            logger.debug("quote_fetch_recorded", symbol=quote.symbol, source=quote.data_source.value)
+            await self.record_quote_fetch_batch(batch)
+    
+    def stop(self):
+        """Ask the batch consumer to exit once the batch it's writing is done"""
+        self._stopping = True
+        try:
+            # Wakes a consumer idling on an empty queue; a full queue means it's busy
+            # and will see the flag after its current batch
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+    
+    async def flush(self):
+        """Write out everything still queued; used on shutdown after the consumer stops"""
+        while not self._queue.empty():
+            batch = []
+            while len(batch) < self.BATCH_SIZE and not self._queue.empty():
+                row = self._queue.get_nowait()
+                if row is not None:
+                    batch.append(row)
+            await self.record_quote_fetch_batch(batch)
+    
+    async def record_quote_fetch_batch(self, rows: List[Dict[str, Any]]) -> bool:
+        """Record a batch of queued quote fetches in a single write"""
+        if not rows:
             return True
-            
-        except Exception as e:
-            logger.error("record_quote_error", error=str(e))
-            return False
+        
+        if await self._client.create_quote_events(rows):
+            logger.debug("quote_fetch_batch_recorded", count=len(rows))
+            return True
+        return False
+    
+    @staticmethod
+    def _quote_row(quote: QuoteData, agent_id: Optional[str]) -> Dict[str, Any]:
+        """Flatten a quote into a row for the batched lineage write"""
+        return {
+            "symbol": quote.symbol.upper(),
+            "instrument_type": "crypto" if "USDT" in quote.symbol else "stock",
+            "event_id": f"quote_{uuid.uuid4().hex[:8]}",
+            "price": quote.price,
+            "timestamp": quote.timestamp.isoformat(),
+            "endpoint_id": QUOTE_ENDPOINTS.get(quote.data_source, "mcp_quote_latest"),
+            "agent_id": agent_id,
+            "api_name": quote.data_source.value if quote.data_source in EXTERNAL_SOURCES else "mcp_server",
+            "latency_ms": quote.latency_ms,
+            "called_at": datetime.utcnow().isoformat()
+        }
 
 
 # Singleton instance
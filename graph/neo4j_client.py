@@ -1,9 +1,10 @@
 """
 Neo4j Client for Graph Database Operations
 """
+import uuid
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from neo4j import GraphDatabase, Session
+from neo4j import AsyncGraphDatabase, GraphDatabase, Session
 from mcp_server.config import get_settings
 from mcp_server.utils.logging import get_logger
 
@@ -19,6 +20,11 @@ class Neo4jClient:
             settings.neo4j_uri,
             auth=(settings.neo4j_user, settings.neo4j_password)
         )
+        # Async driver for writes issued from the event loop
+        self._async_driver = AsyncGraphDatabase.driver(
+            settings.neo4j_uri,
+            auth=(settings.neo4j_user, settings.neo4j_password)
+        )
         self._initialized = False
     
     def connect(self) -> bool:
@@ -63,6 +69,27 @@ class Neo4jClient:
             self._driver.close()
             logger.info("neo4j_disconnected")
     
+    async def close_async(self):
+        """Close both the sync and async driver connections"""
+        self.close()
+        if self._async_driver:
+            await self._async_driver.close()
+    
+    async def warm_up(self) -> bool:
+        """Open a pooled async driver connection ahead of the first write"""
+        try:
+            await self._run_async("RETURN 1")
+            return True
+        except Exception as e:
+            logger.warning("neo4j_warm_up_failed", error=str(e))
+            return False
+    
+    async def _run_async(self, query: str, **params):
+        """Run a write query on the async driver and wait for it to complete"""
+        async with self._async_driver.session() as session:
+            result = await session.run(query, **params)
+            await result.consume()
+    
     # ==================== NODE OPERATIONS ====================
     
     def create_api_node(self, name: str, api_type: str, base_url: str) -> bool:
@@ -251,6 +278,89 @@ class Neo4jClient:
             logger.error("create_depends_on_edge_error", error=str(e))
             return False
     
+    # ==================== BATCH OPERATIONS ====================
+    
+    async def create_quote_events(self, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Create quote Event nodes with their Instrument, EMITS and CALLS
+        relationships for many quotes in one statement
+        """
+        query = """
+        UNWIND $rows AS row
+        MERGE (i:Instrument {symbol: row.symbol})
+        SET i.type = row.instrument_type, i.updated_at = datetime()
+        MERGE (ev:Event {event_id: row.event_id})
+        SET ev.type = 'quote', ev.price = row.price, ev.timestamp = datetime(row.timestamp)
+        MERGE (ev)-[:ABOUT]->(i)
+        WITH row, ev
+        MATCH (e:Endpoint {endpoint_id: row.endpoint_id})
+        MERGE (e)-[:EMITS]->(ev)
+        WITH row
+        WHERE row.agent_id IS NOT NULL
+        MATCH (ag:Agent {agent_id: row.agent_id})
+        MATCH (a:API {name: row.api_name})
+        CREATE (ag)-[:CALLS {
+            latency_ms: row.latency_ms,
+            response_code: 200,
+            timestamp: datetime(row.called_at)
+        }]->(a)
+        """
+        try:
+            await self._run_async(query, rows=rows)
+            return True
+        except Exception as e:
+            logger.error("create_quote_events_error", count=len(rows), error=str(e))
+            return False
+    
+    async def create_agent_call(
+        self,
+        agent_id: str,
+        api_name: str,
+        latency_ms: float,
+        response_code: int,
+        symbol: str,
+        tool_name: str,
+        query_text: Optional[str] = None
+    ) -> bool:
+        """
+        Create the Agent, Instrument and optional Query nodes plus the
+        CALLS edge for one agent call in a single statement
+        """
+        query = """
+        MERGE (ag:Agent {agent_id: $agent_id})
+        SET ag.type = 'langchain', ag.created_at = datetime()
+        MERGE (i:Instrument {symbol: $symbol})
+        SET i.type = 'stock', i.updated_at = datetime()
+        FOREACH (_ IN CASE WHEN $query_text IS NULL THEN [] ELSE [1] END |
+            MERGE (q:Query {query_id: $query_id})
+            SET q.text = $query_text, q.tool = $tool_name, q.created_at = datetime()
+        )
+        WITH ag
+        MATCH (a:API {name: $api_name})
+        CREATE (ag)-[:CALLS {
+            latency_ms: $latency_ms,
+            response_code: $response_code,
+            timestamp: datetime($timestamp)
+        }]->(a)
+        """
+        try:
+            await self._run_async(
+                query,
+                agent_id=agent_id,
+                api_name=api_name,
+                latency_ms=latency_ms,
+                response_code=response_code,
+                symbol=symbol.upper(),
+                tool_name=tool_name,
+                query_id=f"q_{uuid.uuid4().hex[:8]}",
+                query_text=query_text,
+                timestamp=datetime.utcnow().isoformat()
+            )
+            return True
+        except Exception as e:
+            logger.error("create_agent_call_error", error=str(e))
+            return False
+    
     # ==================== QUERY OPERATIONS ====================
     
     def get_agent_call_history(self, agent_id: str, limit: int = 100) -> List[Dict[str, Any]]:
@@ -15,13 +15,17 @@ logger = get_logger(__name__)
 USD_TO_INR = 89.94
 
 
+class GeminiNotConfiguredError(ValueError):
+    """Raised when no Gemini API key is configured"""
+
+
 class GeminiChatAgent:
     """Gemini-powered chat agent with MCP tool access"""
     
     def __init__(self):
         settings = get_settings()
         if not settings.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY not configured")
+            raise GeminiNotConfiguredError("GEMINI_API_KEY not configured")
         
         genai.configure(api_key=settings.gemini_api_key)
         self.tools = self._create_tools()
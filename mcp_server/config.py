@@ -35,6 +35,8 @@ class Settings(BaseSettings):
     mcp_server_port: int = 8000
     mcp_server_name: str = "finance-mcp"
     mcp_server_version: str = "1.0.0"
+    mcp_server_workers: int = 1  # Subscriptions are per-process; see README before raising
+    mcp_server_dev: bool = False  # Single worker with auto-reload
 
     # Cache Configuration
     default_max_age_sec: int = 60
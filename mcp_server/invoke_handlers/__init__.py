@@ -1,9 +1,17 @@
 from mcp_server.invoke_handlers.quote_latest import handle_quote_latest
-from mcp_server.invoke_handlers.quote_stream import handle_quote_stream, handle_unsubscribe, get_active_subscriptions
+from mcp_server.invoke_handlers.quote_stream import (
+    handle_quote_stream,
+    handle_unsubscribe,
+    get_active_subscriptions,
+    get_active_subscription_count,
+    get_tick_queue
+)
 
 __all__ = [
     "handle_quote_latest",
     "handle_quote_stream",
     "handle_unsubscribe",
-    "get_active_subscriptions"
+    "get_active_subscriptions",
+    "get_active_subscription_count",
+    "get_tick_queue"
 ]
@@ -4,8 +4,13 @@ MCP tool: quote.latest
 """
 import time
 import json
+import asyncio
+import operator
+import msgspec
 from typing import Optional
 from datetime import datetime
+from cachetools import TTLCache
+from redis.exceptions import RedisError
 from mcp_server.utils.logging import get_logger
 from mcp_server.utils.validation import InputValidator
 from mcp_server.schemas import QuoteData, ToolResponse, DataSource
@@ -18,6 +23,30 @@ from graph.lineage_writer import get_lineage_writer
 
 logger = get_logger(__name__)
 
+_json_encoder = msgspec.json.Encoder()
+
+# Data source values bound once for the response paths
+_DS_SEMANTIC = DataSource.SEMANTIC_CACHE.value
+_DS_LOCAL = DataSource.LOCAL_CACHE.value
+_DS_REDIS = DataSource.REDIS_CACHE.value
+_DS_BINANCE = DataSource.BINANCE
+
+# Response fields for _quote_to_dict; timestamp and data_source stay at index 2 and 3
+_QUOTE_KEYS = (
+    "symbol", "price", "timestamp", "data_source", "cache_hit", "latency_ms",
+    "volume", "high", "low", "open", "previous_close"
+)
+_get_quote_attrs = operator.attrgetter(*_QUOTE_KEYS)
+
+# Pending fire-and-forget cache writes
+_background_tasks: set = set()
+
+# Process-local hot cache, checked before Redis
+_local_snapshot_cache: TTLCache = TTLCache(
+    maxsize=512,
+    ttl=get_settings().default_max_age_sec
+)
+
 
 async def handle_quote_latest(
     symbol: str,
@@ -31,7 +60,7 @@ async def handle_quote_latest(
     
     Flow:
     1. Check semantic cache for similar queries
-    2. Check Redis hot cache
+    2. Check process-local cache, then Redis hot cache
     3. If cache miss or stale, call connectors with fallback
     4. Update caches
     5. Record lineage
@@ -41,70 +70,101 @@ async def handle_quote_latest(
     settings = get_settings()
     
     try:
-        # Validate inputs
-        symbol = InputValidator.validate_symbol(symbol)
-        exchange = InputValidator.validate_exchange(exchange)
-        max_age_sec = InputValidator.validate_max_age_sec(max_age_sec) or settings.default_max_age_sec
-        
-        logger.info(
-            "quote_latest_request",
-            symbol=symbol,
-            exchange=exchange,
-            max_age_sec=max_age_sec
-        )
-        
-        # Initialize clients
-        redis_client = get_redis_client()
         semantic_cache = get_semantic_cache()
-        lineage_writer = get_lineage_writer()
         
-        # 1. Check semantic cache first
+        # 1. Check semantic cache first; a hit skips full validation, Redis and connectors.
+        # An empty symbol would disable the lookup's symbol filter, so reject it up front;
+        # any other invalid symbol can't match since only validated symbols are ever stored.
         if query_text:
-            semantic_hit = semantic_cache.search_similar(
+            if not symbol or not symbol.strip():
+                raise ValueError("Symbol cannot be empty")
+            
+            semantic_hit = await semantic_cache.search_similar_async(
                 query_text=query_text,
-                symbol=symbol,
+                symbol=symbol.strip().upper(),
                 agent_id=agent_id
             )
             
             if semantic_hit:
-                logger.info("semantic_cache_hit", symbol=symbol)
+                logger.info("semantic_cache_hit", symbol=semantic_hit["symbol"])
                 latency_ms = (time.time() - start_time) * 1000
                 
                 return ToolResponse(
                     success=True,
                     data={
-                        "symbol": symbol,
+                        "symbol": semantic_hit["symbol"],
                         "price": json.loads(semantic_hit["response_text"]).get("price"),
                         "timestamp": datetime.utcnow().isoformat(),
-                        "data_source": DataSource.SEMANTIC_CACHE.value,
+                        "data_source": _DS_SEMANTIC,
                         "cache_hit": True,
                         "latency_ms": latency_ms
                     },
                     cache_hit=True,
-                    data_source=DataSource.SEMANTIC_CACHE.value,
+                    data_source=_DS_SEMANTIC,
                     latency_ms=latency_ms
                 )
         
-        # 2. Check Redis hot cache
-        if redis_client.is_connected():
-            if redis_client.is_snapshot_fresh(symbol, max_age_sec):
-                quote = redis_client.get_snapshot(symbol)
-                
-                if quote:
-                    latency_ms = (time.time() - start_time) * 1000
-                    quote.cache_hit = True
-                    quote.latency_ms = latency_ms
-                    quote.data_source = DataSource.REDIS_CACHE
-                    
-                    logger.info("redis_cache_hit", symbol=symbol)
-                    
-                    return ToolResponse(
-                        success=True,
-                        data=_quote_to_dict(quote),
-                        cache_hit=True,
-                        data_source=DataSource.REDIS_CACHE.value,
-                        latency_ms=latency_ms
-                    )
+        # Validate inputs
+        symbol = InputValidator.validate_symbol(symbol)
+        exchange = InputValidator.validate_exchange(exchange)
+        max_age_sec = InputValidator.validate_max_age_sec(max_age_sec) or settings.default_max_age_sec
+        
+        logger.info(
+            "quote_latest_request",
+            symbol=symbol,
+            exchange=exchange,
+            max_age_sec=max_age_sec
+        )
+        
+        # Initialize clients
+        redis_client = get_redis_client()
+        lineage_writer = get_lineage_writer()
+        
+        # 2. Check process-local cache, then Redis hot cache
+        local_quote = _local_snapshot_cache.get(symbol)
+        if local_quote and (datetime.utcnow() - local_quote.timestamp).total_seconds() < max_age_sec:
+            latency_ms = (time.time() - start_time) * 1000
+            quote = msgspec.structs.replace(
+                local_quote,
+                cache_hit=True,
+                latency_ms=latency_ms,
+                data_source=DataSource.LOCAL_CACHE
+            )
+            
+            logger.info("local_cache_hit", symbol=symbol)
+            
+            return ToolResponse(
+                success=True,
+                data=_quote_to_dict(quote),
+                cache_hit=True,
+                data_source=_DS_LOCAL,
+                latency_ms=latency_ms
+            )
+        
+        # One round-trip; an unreachable Redis counts as a miss and skips the write-back
+        try:
+            quote = await redis_client.get_snapshot_if_fresh_async(symbol, max_age_sec)
+            redis_available = True
+        except RedisError as e:
+            logger.warning("redis_snapshot_unavailable", symbol=symbol, error=str(e))
+            quote = None
+            redis_available = False
+        
+        if quote:
+            latency_ms = (time.time() - start_time) * 1000
+            quote.cache_hit = True
+            quote.latency_ms = latency_ms
+            quote.data_source = DataSource.REDIS_CACHE
+            
+            logger.info("redis_cache_hit", symbol=symbol)
+            
+            return ToolResponse(
+                success=True,
+                data=_quote_to_dict(quote),
+                cache_hit=True,
+                data_source=_DS_REDIS,
+                latency_ms=latency_ms
+            )
         
         # 3. Cache miss - fetch from connectors with fallback
         quote = await _fetch_with_fallback(symbol, exchange)
@@ -117,31 +177,39 @@ async def handle_quote_latest(
                 latency_ms=latency_ms
             )
         
-        # 4. Update Redis cache
-        if redis_client.is_connected():
-            redis_client.set_snapshot(quote)
+        # 4. Update local cache inline; Redis and semantic cache in the background
+        _local_snapshot_cache[symbol] = quote
+        cache_writes = []
+        
+        if redis_available:
+            # Copy so the later latency update doesn't leak into the snapshot
+            cache_writes.append(redis_client.set_snapshot_async(msgspec.structs.replace(quote)))
         
         # 5. Update semantic cache
         if query_text and agent_id:
-            semantic_cache.store_response(
+            cache_writes.append(semantic_cache.store_response_async(
                 agent_id=agent_id,
                 symbol=symbol,
                 query_text=query_text,
-                response_text=json.dumps(_quote_to_dict(quote))
-            )
+                response_text=_json_encoder.encode(quote).decode()
+            ))
         
-        # 6. Record lineage
+        if cache_writes:
+            _run_in_background(asyncio.gather(*cache_writes))
+        
+        # 6. Queue lineage for the background batch writer
         if agent_id:
-            lineage_writer.record_quote_fetch(quote, agent_id)
+            lineage_writer.enqueue_quote_fetch(quote, agent_id)
         
         latency_ms = (time.time() - start_time) * 1000
         quote.latency_ms = latency_ms
+        source = quote.data_source.value
         
         logger.info(
             "quote_latest_response",
             symbol=symbol,
             price=quote.price,
-            source=quote.data_source.value,
+            source=source,
             latency_ms=latency_ms
         )
         
@@ -149,7 +217,7 @@ async def handle_quote_latest(
             success=True,
             data=_quote_to_dict(quote),
             cache_hit=False,
-            data_source=quote.data_source.value,
+            data_source=source,
             latency_ms=latency_ms
         )
         
@@ -171,6 +239,13 @@ async def handle_quote_latest(
         )
 
 
+def _run_in_background(aw) -> None:
+    """Schedule a fire-and-forget awaitable, holding a reference until it finishes"""
+    task = asyncio.ensure_future(aw)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
 async def _fetch_with_fallback(symbol: str, exchange: Optional[str] = None) -> Optional[QuoteData]:
     """
     Fetch quote from connectors with fallback chain:
@@ -193,7 +268,7 @@ async def _fetch_with_fallback(symbol: str, exchange: Optional[str] = None) -> O
                     symbol=tick.symbol,
                     price=tick.price,
                     timestamp=tick.timestamp,
-                    data_source=DataSource.BINANCE,
+                    data_source=_DS_BINANCE,
                     volume=tick.volume
                 )
         except Exception as e:
@@ -222,16 +297,8 @@ async def _fetch_with_fallback(symbol: str, exchange: Optional[str] = None) -> O
 
 def _quote_to_dict(quote: QuoteData) -> dict:
     """Convert QuoteData to dictionary for response"""
-    return {
-        "symbol": quote.symbol,
-        "price": quote.price,
-        "timestamp": quote.timestamp.isoformat(),
-        "data_source": quote.data_source.value,
-        "cache_hit": quote.cache_hit,
-        "latency_ms": quote.latency_ms,
-        "volume": quote.volume,
-        "high": quote.high,
-        "low": quote.low,
-        "open": quote.open,
-        "previous_close": quote.previous_close
-    }
+    values = _get_quote_attrs(quote)
+    data = dict(zip(_QUOTE_KEYS, values))
+    data["timestamp"] = values[2].isoformat()
+    data["data_source"] = values[3].value
+    return data
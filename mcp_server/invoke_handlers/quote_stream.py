@@ -3,6 +3,7 @@ Quote Stream Tool Handler
 MCP tool: quote.stream
 """
 import uuid
+import asyncio
 from typing import Optional
 from mcp_server.utils.logging import get_logger
 from mcp_server.utils.validation import InputValidator
@@ -15,6 +16,9 @@ logger = get_logger(__name__)
 # Active subscriptions registry
 _active_subscriptions = {}
 
+# Copy served by get_active_subscriptions; rebuilt only after the registry changes
+_subscriptions_view: Optional[dict] = None
+
 
 async def handle_quote_stream(
     symbol: str,
@@ -53,11 +57,12 @@ async def handle_quote_stream(
             "channel": channel,
             "agent_id": agent_id
         }
+        _invalidate_subscriptions_view()
         
         # Record lineage if agent provided
         if agent_id:
             lineage_writer = get_lineage_writer()
-            lineage_writer.record_agent_call(
+            await lineage_writer.record_agent_call(
                 agent_id=agent_id,
                 api_name="binance",
                 latency_ms=0,
@@ -127,6 +132,7 @@ async def handle_unsubscribe(subscription_id: str) -> ToolResponse:
         if success:
             # Remove from registry
             sub_info = _active_subscriptions.pop(subscription_id, {})
+            _invalidate_subscriptions_view()
             
             logger.info(
                 "quote_stream_unsubscribed",
@@ -156,5 +162,29 @@ async def handle_unsubscribe(subscription_id: str) -> ToolResponse:
 
 
 def get_active_subscriptions() -> dict:
-    """Get all active subscriptions"""
-    return dict(_active_subscriptions)
+    """
+    Get all active subscriptions
+    The returned dict is shared between callers until the registry changes; don't mutate it
+    """
+    global _subscriptions_view
+    if _subscriptions_view is None:
+        _subscriptions_view = dict(_active_subscriptions)
+    return _subscriptions_view
+
+
+def get_active_subscription_count() -> int:
+    """Get the number of active subscriptions"""
+    return len(_active_subscriptions)
+
+
+def _invalidate_subscriptions_view() -> None:
+    """Mark the get_active_subscriptions copy stale after a registry change"""
+    global _subscriptions_view
+    _subscriptions_view = None
+
+
+def get_tick_queue(subscription_id: str) -> Optional[asyncio.Queue]:
+    """Get the raw tick queue for an active subscription"""
+    if subscription_id not in _active_subscriptions:
+        return None
+    return get_binance_connector().get_tick_queue(subscription_id)
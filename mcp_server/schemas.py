@@ -1,8 +1,9 @@
 """
 Unified Financial Data Schema
 """
-from pydantic import BaseModel, Field
-from typing import Optional
+import msgspec
+from pydantic import BaseModel, Field, Discriminator, Tag, field_validator
+from typing import Optional, Literal, Union, Annotated
 from datetime import datetime
 from enum import Enum
 
@@ -12,32 +13,28 @@ class DataSource(str, Enum):
     FINNHUB = "finnhub"
     BINANCE = "binance"
     REDIS_CACHE = "redis_cache"
+    LOCAL_CACHE = "local_cache"
     SEMANTIC_CACHE = "semantic_cache"
 
 
-class QuoteData(BaseModel):
+class QuoteData(msgspec.Struct, kw_only=True):
     """Unified quote data schema for all connectors"""
-    symbol: str = Field(..., description="Ticker symbol")
-    price: float = Field(..., description="Current price")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    data_source: DataSource = Field(..., description="Origin of data")
-    cache_hit: bool = Field(default=False)
-    latency_ms: float = Field(default=0.0)
-    volume: Optional[float] = Field(default=None)
-    bid: Optional[float] = Field(default=None)
-    ask: Optional[float] = Field(default=None)
-    high: Optional[float] = Field(default=None)
-    low: Optional[float] = Field(default=None)
-    open: Optional[float] = Field(default=None)
-    previous_close: Optional[float] = Field(default=None)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
-
-class StreamTick(BaseModel):
+    symbol: str
+    price: float
+    timestamp: datetime = msgspec.field(default_factory=datetime.utcnow)
+    data_source: DataSource
+    cache_hit: bool = False
+    latency_ms: float = 0.0
+    volume: Optional[float] = None
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    open: Optional[float] = None
+    previous_close: Optional[float] = None
+
+
+class StreamTick(msgspec.Struct, kw_only=True):
     """Single tick from a real-time stream"""
     symbol: str
     price: float
@@ -46,11 +43,6 @@ class StreamTick(BaseModel):
     trade_id: Optional[str] = None
     data_source: DataSource = DataSource.BINANCE
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class ToolInvocation(BaseModel):
     """MCP Tool invocation request"""
@@ -59,6 +51,52 @@ class ToolInvocation(BaseModel):
     agent_id: Optional[str] = Field(default=None)
     query_text: Optional[str] = Field(default=None)
 
+    @field_validator("tool_name", mode="before")
+    @classmethod
+    def normalize_tool_name(cls, value):
+        return value.strip().lower() if isinstance(value, str) else value
+
+
+class QuoteLatestArgs(BaseModel):
+    """Arguments for quote.latest"""
+    symbol: str
+    exchange: Optional[str] = None
+    max_age_sec: Optional[int] = Field(default=None, alias="maxAgeSec")
+
+
+class QuoteStreamArgs(BaseModel):
+    """Arguments for quote.stream"""
+    symbol: str
+    channel: str = "trades"
+
+
+class QuoteLatestInvocation(ToolInvocation):
+    """quote.latest invocation with typed arguments"""
+    tool_name: Literal["quote.latest"]
+    arguments: QuoteLatestArgs
+
+
+class QuoteStreamInvocation(ToolInvocation):
+    """quote.stream invocation with typed arguments"""
+    tool_name: Literal["quote.stream"]
+    arguments: QuoteStreamArgs
+
+
+def _tool_name_tag(value) -> Optional[str]:
+    """Case-insensitive discriminator for tool invocations"""
+    tool_name = value.get("tool_name") if isinstance(value, dict) else getattr(value, "tool_name", None)
+    return tool_name.strip().lower() if isinstance(tool_name, str) else None
+
+
+# Request body for /invoke, parsed into the matching tool's model in one pass
+ToolInvocationRequest = Annotated[
+    Union[
+        Annotated[QuoteLatestInvocation, Tag("quote.latest")],
+        Annotated[QuoteStreamInvocation, Tag("quote.stream")],
+    ],
+    Discriminator(_tool_name_tag),
+]
+
 
 class ToolResponse(BaseModel):
     """MCP Tool response wrapper"""
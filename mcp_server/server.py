@@ -2,32 +2,57 @@
 Finance MCP Server - FastAPI Application
 
 """
-import json
+import asyncio
+import hmac
+import orjson
+from functools import lru_cache
 from pathlib import Path
 from contextlib import asynccontextmanager
-from typing import Optional
-from fastapi import FastAPI, HTTPException, Request, Security, status
+from typing import Annotated, Awaitable, Optional
+import ormsgpack
+from fastapi import FastAPI, Body, HTTPException, Request, Security, WebSocket, WebSocketDisconnect, status
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security.api_key import APIKeyHeader
 from pydantic import BaseModel
+from websockets.exceptions import ConnectionClosed
 
 from mcp_server.config import get_settings
 from mcp_server.utils.logging import setup_logging, get_logger
-from mcp_server.schemas import ToolInvocation, ToolResponse, SubscriptionRequest
+from mcp_server.schemas import (
+    ToolInvocationRequest,
+    QuoteLatestInvocation,
+    QuoteStreamInvocation,
+    ToolResponse,
+    SubscriptionRequest
+)
 from mcp_server.invoke_handlers import (
     handle_quote_latest,
     handle_quote_stream,
     handle_unsubscribe,
-    get_active_subscriptions
+    get_active_subscriptions,
+    get_active_subscription_count,
+    get_tick_queue
 )
 from cache.redis_client import get_redis_client
 from cache.qdrant_client import get_semantic_cache
 from graph.lineage_writer import get_lineage_writer
+from connectors.alpha_vantage import get_alpha_vantage_connector
+from connectors.finnhub import get_finnhub_connector
 
 try:
-    from mcp_server.chat_agent import get_chat_agent
+    from google.api_core.exceptions import TooManyRequests, Unauthenticated
+    from mcp_server.chat_agent import get_chat_agent, GeminiNotConfiguredError
     GEMINI_AVAILABLE = True
+    
+    # User-facing messages for known Gemini failures; anything else is passed through
+    _CHAT_ERROR_MESSAGES = {
+        TooManyRequests: "The Gemini API quota has been exceeded. Please try again in a few moments or check your API billing settings.",
+        Unauthenticated: "Invalid Gemini API key. Please check your configuration.",
+        GeminiNotConfiguredError: "Gemini API key not configured. Please add it to your environment settings."
+    }
 except Exception:
     GEMINI_AVAILABLE = False
 
@@ -38,14 +63,47 @@ logger = get_logger(__name__)
 # Load capabilities
 CAPABILITIES_PATH = Path(__file__).parent / "capabilities.json"
 
+
+@lru_cache(maxsize=1)
+def _load_capabilities(mtime_ns: int) -> bytes:
+    """
+    Read capabilities.json as raw bytes, checking that it parses
+    Keyed on the file's mtime so edits are picked up without a restart
+    """
+    content = CAPABILITIES_PATH.read_bytes()
+    orjson.loads(content)
+    return content
+
+
+def _get_capabilities() -> bytes:
+    """Get capabilities.json bytes, re-reading only if the file changed"""
+    return _load_capabilities(CAPABILITIES_PATH.stat().st_mtime_ns)
+
+
 # API Key Security
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Bound once at import; settings are immutable for the process lifetime
+_API_KEY = get_settings().mcp_api_key.encode()
+
+
+def _model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Serialize a response model straight to JSON bytes with pydantic-core"""
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def _is_valid_api_key(api_key: Optional[str]) -> bool:
+    """Constant-time comparison against the configured API key"""
+    return bool(api_key) and hmac.compare_digest(api_key.encode(), _API_KEY)
+
 
 async def get_api_key(api_key: str = Security(api_key_header)):
     """Validate API key from request header"""
-    settings = get_settings()
-    if api_key == settings.mcp_api_key:
+    if _is_valid_api_key(api_key):
         return api_key
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
@@ -58,9 +116,15 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler"""
     logger.info("mcp_server_starting")
     
+    # Load capabilities up front; /capabilities serves the cached bytes as-is
+    try:
+        _get_capabilities()
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
+        logger.error("capabilities_load_failed", error=str(e))
+    
     # Initialize Redis
     redis_client = get_redis_client()
-    if redis_client.connect():
+    if await redis_client.is_connected_async():
         logger.info("redis_initialized")
     else:
         logger.warning("redis_connection_failed")
@@ -74,18 +138,48 @@ async def lifespan(app: FastAPI):
     
     # Initialize Neo4j lineage
     lineage_writer = get_lineage_writer()
-    if lineage_writer.initialize():
+    neo4j_ready = lineage_writer.initialize()
+    if neo4j_ready:
         logger.info("neo4j_initialized")
     else:
         logger.warning("neo4j_initialization_failed")
     
+    # Open pooled connections now so early requests skip TCP/TLS setup.
+    # Redis' async pool was already opened by the ping above.
+    finnhub = get_finnhub_connector()
+    alpha_vantage = get_alpha_vantage_connector()
+    warm_ups = [finnhub.warm_up(), alpha_vantage.warm_up()]
+    if neo4j_ready:
+        warm_ups.append(lineage_writer.warm_up())
+    await asyncio.gather(*warm_ups)
+    
+    # Background batch writer for quote lineage; nothing is queued without Neo4j
+    lineage_task = None
+    if neo4j_ready:
+        lineage_task = asyncio.create_task(lineage_writer.run_batch_consumer())
+    
     logger.info("mcp_server_started")
     
     yield
     
     # Cleanup
     logger.info("mcp_server_stopping")
-    redis_client.close()
+    if lineage_task:
+        # Let the consumer finish the batch in flight, then write what's left.
+        # Both steps are bounded so an unreachable Neo4j can't stall shutdown.
+        lineage_writer.stop()
+        try:
+            await asyncio.wait_for(lineage_task, lineage_writer.SHUTDOWN_TIMEOUT_SEC)
+        except asyncio.TimeoutError:
+            logger.warning("lineage_consumer_stop_timeout")
+        try:
+            await asyncio.wait_for(lineage_writer.flush(), lineage_writer.SHUTDOWN_TIMEOUT_SEC)
+        except asyncio.TimeoutError:
+            logger.warning("lineage_flush_timeout")
+    await lineage_writer.close()
+    await finnhub.close()
+    await alpha_vantage.close()
+    await redis_client.close_async()
 
 
 #  FastAPI app
@@ -94,6 +188,7 @@ app = FastAPI(
     title=settings.mcp_server_name,
     version=settings.mcp_server_version,
     description="Real-Time Financial Data MCP Integration System",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -105,25 +200,10 @@ app.add_middleware(
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],
     expose_headers=["*"],
+    max_age=86400,
 )
 
 
-# CORS PREFLIGHT HANDLER
-# Explicit handler for CORS preflight requests
-@app.options("/{path:path}")
-async def options_handler(path: str):
-    """Handle CORS preflight requests for all paths"""
-    return Response(
-        status_code=200,
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
-            "Access-Control-Allow-Headers": "*",
-            "Access-Control-Max-Age": "86400",
-        }
-    )
-
-
 # MCP ENDPOINTS
 
 @app.get("/.well-known/mcp")
@@ -153,19 +233,45 @@ async def get_capabilities():
     Returns available MCP tools and connectors
     """
     try:
-        with open(CAPABILITIES_PATH, "r") as f:
-            capabilities = json.load(f)
-        return capabilities
+        return Response(content=_get_capabilities(), media_type="application/json")
     except FileNotFoundError:
         logger.error("capabilities_file_not_found")
         raise HTTPException(status_code=500, detail="Capabilities file not found")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error("capabilities_json_error")
         raise HTTPException(status_code=500, detail="Invalid capabilities file")
 
 
+def _invoke_quote_latest(request: QuoteLatestInvocation) -> Awaitable[ToolResponse]:
+    """Adapt a quote.latest invocation to its handler's arguments"""
+    args = request.arguments
+    return handle_quote_latest(
+        symbol=args.symbol,
+        exchange=args.exchange,
+        max_age_sec=args.max_age_sec,
+        agent_id=request.agent_id,
+        query_text=request.query_text
+    )
+
+
+def _invoke_quote_stream(request: QuoteStreamInvocation) -> Awaitable[ToolResponse]:
+    """Adapt a quote.stream invocation to its handler's arguments"""
+    args = request.arguments
+    return handle_quote_stream(
+        symbol=args.symbol,
+        channel=args.channel,
+        agent_id=request.agent_id
+    )
+
+
+_TOOL_DISPATCH = {
+    "quote.latest": _invoke_quote_latest,
+    "quote.stream": _invoke_quote_stream
+}
+
+
 @app.post("/invoke", dependencies=[Security(get_api_key)])
-async def invoke_tool(request: ToolInvocation):
+async def invoke_tool(request: Annotated[ToolInvocationRequest, Body()]):
     """
     Execute an MCP tool
     
@@ -173,56 +279,33 @@ async def invoke_tool(request: ToolInvocation):
     - quote.latest: Get latest price quote
     - quote.stream: Subscribe to real-time stream
     
+    Arguments are parsed into the tool's typed model before this runs;
+    malformed requests are answered by the validation error handler.
+    
     Requires X-API-Key header
     """
+    args = request.arguments
+    
     logger.info(
         "invoke_request",
         tool=request.tool_name,
-        args=request.arguments
+        args=args.model_dump(by_alias=True)
     )
     
     try:
-        tool_name = request.tool_name.lower()
-        args = request.arguments
-        
-        if tool_name == "quote.latest":
-            response = await handle_quote_latest(
-                symbol=args.get("symbol"),
-                exchange=args.get("exchange"),
-                max_age_sec=args.get("maxAgeSec"),
-                agent_id=request.agent_id,
-                query_text=request.query_text
-            )
-        
-        elif tool_name == "quote.stream":
-            response = await handle_quote_stream(
-                symbol=args.get("symbol"),
-                channel=args.get("channel", "trades"),
-                agent_id=request.agent_id
-            )
+        # tool_name is already a normalized Literal, so the lookup can't miss
+        response = await _TOOL_DISPATCH[request.tool_name](request)
         
-        else:
-            response = ToolResponse(
-                success=False,
-                error=f"Unknown tool: {tool_name}. Available tools: quote.latest, quote.stream"
-            )
-        
-        if response.success:
-            return JSONResponse(content=response.model_dump())
-        else:
-            return JSONResponse(
-                status_code=400,
-                content=response.model_dump()
-            )
+        return _model_response(response, status_code=200 if response.success else 400)
             
     except Exception as e:
         logger.error("invoke_error", error=str(e))
-        return JSONResponse(
-            status_code=500,
-            content=ToolResponse(
+        return _model_response(
+            ToolResponse(
                 success=False,
                 error=f"Internal error: {str(e)}"
-            ).model_dump()
+            ),
+            status_code=500
         )
 
 
@@ -246,17 +329,11 @@ async def subscribe(request: SubscriptionRequest):
             agent_id=request.agent_id
         )
         
-        if response.success:
-            return JSONResponse(content=response.model_dump())
-        else:
-            return JSONResponse(
-                status_code=400,
-                content=response.model_dump()
-            )
+        return _model_response(response, status_code=200 if response.success else 400)
             
     except Exception as e:
         logger.error("subscribe_error", error=str(e))
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "error": str(e)}
         )
@@ -278,22 +355,75 @@ async def unsubscribe(request: UnsubscribeRequest):
     try:
         response = await handle_unsubscribe(request.subscription_id)
         
-        if response.success:
-            return JSONResponse(content=response.model_dump())
-        else:
-            return JSONResponse(
-                status_code=400,
-                content=response.model_dump()
-            )
+        return _model_response(response, status_code=200 if response.success else 400)
             
     except Exception as e:
         logger.error("unsubscribe_error", error=str(e))
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"success": False, "error": str(e)}
         )
 
 
+@app.websocket("/stream/{subscription_id}")
+async def stream_ticks(websocket: WebSocket, subscription_id: str):
+    """
+    Stream ticks for a subscription as binary msgpack frames
+    
+    Each frame is an array: [symbol, price, volume, ts_ms, trade_id]
+    
+    Requires X-API-Key header
+    """
+    if not _is_valid_api_key(websocket.headers.get("X-API-Key")):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    tick_queue = get_tick_queue(subscription_id)
+    if tick_queue is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    await websocket.accept()
+    logger.info("stream_connected", subscription_id=subscription_id)
+    
+    # Watch for the client going away even while the queue is quiet
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(websocket))
+    next_tick = None
+    
+    try:
+        while True:
+            next_tick = asyncio.ensure_future(tick_queue.get())
+            await asyncio.wait({next_tick, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected.done():
+                break
+            
+            tick = next_tick.result()
+            if tick is None:
+                await websocket.close()
+                break
+            await websocket.send_bytes(ormsgpack.packb(tick))
+    except (WebSocketDisconnect, ConnectionClosed):
+        pass
+    finally:
+        disconnected.cancel()
+        if next_tick is not None:
+            next_tick.cancel()
+    
+    logger.info("stream_disconnected", subscription_id=subscription_id)
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    """Consume client messages until the client disconnects; /stream is send-only"""
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+    except (WebSocketDisconnect, ConnectionClosed, RuntimeError):
+        # Receiving on a dead connection means the client is gone too
+        return
+
+
 # AI CHAT ENDPOINT
 
 class ChatRequest(BaseModel):
@@ -315,48 +445,47 @@ async def chat(request: ChatRequest):
     Requires X-API-Key header
     """
     if not GEMINI_AVAILABLE:
-        return JSONResponse(
-            status_code=503,
-            content=ChatResponse(
+        return _model_response(
+            ChatResponse(
                 response="",
                 success=False,
                 error="Gemini chat agent not available. Check GEMINI_API_KEY configuration."
-            ).model_dump()
+            ),
+            status_code=503
         )
     
     try:
         agent = get_chat_agent()
         response_text = await agent.chat(request.message)
         
-        return JSONResponse(
-            content=ChatResponse(
+        return _model_response(
+            ChatResponse(
                 response=response_text,
                 success=True
-            ).model_dump()
+            )
         )
     
     except Exception as e:
         logger.error(f"Chat endpoint error: {e}")
-        error_msg = str(e)
         
-        #  common Gemini errors
-        if "429" in error_msg or "quota" in error_msg.lower():
-            error_msg = "The Gemini API quota has been exceeded. Please try again in a few moments or check your API billing settings."
-        elif "401" in error_msg or "authentication" in error_msg.lower():
-            error_msg = "Invalid Gemini API key. Please check your configuration."
-        elif "GEMINI_API_KEY" in error_msg:
-            error_msg = "Gemini API key not configured. Please add it to your environment settings."
-        
-        return JSONResponse(
-            status_code=200,  # Return 200 so frontend can display error message
-            content=ChatResponse(
+        return _model_response(
+            ChatResponse(
                 response="",
                 success=False,
-                error=error_msg
-            ).model_dump()
+                error=_chat_error_message(e)
+            ),
+            status_code=200  # Return 200 so frontend can display error message
         )
 
 
+def _chat_error_message(exc: Exception) -> str:
+    """Map known Gemini exception types to a user-facing message"""
+    for exc_type, message in _CHAT_ERROR_MESSAGES.items():
+        if isinstance(exc, exc_type):
+            return message
+    return str(exc)
+
+
 #  UTILITY ENDPOINTS 
 
 @app.get("/health")
@@ -366,8 +495,8 @@ async def health_check():
     
     return {
         "status": "healthy",
-        "redis_connected": redis_client.is_connected(),
-        "active_subscriptions": len(get_active_subscriptions())
+        "redis_connected": await redis_client.is_connected_async(),
+        "active_subscriptions": get_active_subscription_count()
     }
 
 
@@ -381,10 +510,44 @@ async def list_subscriptions():
 
 #  ERROR HANDLERS 
 
+def _invoke_validation_error(exc: RequestValidationError) -> str:
+    """Summarize an /invoke body validation failure as a single error message"""
+    error = exc.errors()[0]
+    
+    if error["type"] == "union_tag_invalid":
+        if not error["ctx"]["tag"]:
+            return "Tool name cannot be empty"
+        return f"Unknown tool: {error['ctx']['tag']}. Available tools: quote.latest, quote.stream"
+    if error["type"] == "union_tag_not_found":
+        # The discriminator found no usable tool_name; say why from the raw body
+        body = error.get("input")
+        if not isinstance(body, dict):
+            return "Request body must be a JSON object"
+        if body.get("tool_name") is None:
+            return "tool_name is required"
+        return "tool_name must be a string"
+    if error["type"] == "json_invalid":
+        # loc ends in a byte offset here, not a field name
+        return "Request body is not valid JSON"
+    
+    return f"Invalid {error['loc'][-1]}: {error['msg']}"
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    # /invoke keeps the ToolResponse error shape; other endpoints use FastAPI's default
+    if request.url.path != "/invoke":
+        return await request_validation_exception_handler(request, exc)
+    
+    error = _invoke_validation_error(exc)
+    logger.error("invoke_validation_error", error=error)
+    return _model_response(ToolResponse(success=False, error=error), status_code=400)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.error("unhandled_exception", error=str(exc), path=request.url.path)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"success": False, "error": "Internal server error"}
     )
@@ -392,9 +555,20 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(
-        "mcp_server.server:app",
-        host=settings.mcp_server_host,
-        port=settings.mcp_server_port,
-        reload=True
-    )
+    
+    if settings.mcp_server_dev:
+        uvicorn.run(
+            "mcp_server.server:app",
+            host=settings.mcp_server_host,
+            port=settings.mcp_server_port,
+            reload=True
+        )
+    else:
+        uvicorn.run(
+            "mcp_server.server:app",
+            host=settings.mcp_server_host,
+            port=settings.mcp_server_port,
+            loop="uvloop",
+            http="httptools",
+            workers=settings.mcp_server_workers
+        )
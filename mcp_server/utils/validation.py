@@ -1,18 +1,21 @@
 """
 Input validation utilities
 """
-import re
 from typing import Optional
 from mcp_server.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_DROP_UNDERSCORE = str.maketrans("", "", "_")
+
+# C0 and C1 control characters (\x00-\x1f, \x7f-\x9f) mapped to deletion
+_CTRL_TABLE = dict.fromkeys([*range(0x20), *range(0x7f, 0xa0)])
+
 
 class InputValidator:
     """Validates and sanitizes input parameters"""
     
-    SYMBOL_PATTERN = re.compile(r'^[A-Z0-9]{1,20}$', re.IGNORECASE)
-    EXCHANGE_PATTERN = re.compile(r'^[A-Z0-9_]{1,20}$', re.IGNORECASE)
+    MAX_IDENTIFIER_LENGTH = 20
     
     VALID_TOOLS = {"quote.latest", "quote.stream"}
     VALID_CHANNELS = {"trades", "quotes"}
@@ -25,7 +28,8 @@ class InputValidator:
         
         symbol = symbol.strip().upper()
         
-        if not cls.SYMBOL_PATTERN.match(symbol):
+        # Equivalent to ^[A-Z0-9]{1,20}$ using C-level str checks
+        if not (len(symbol) <= cls.MAX_IDENTIFIER_LENGTH and symbol.isascii() and symbol.isalnum()):
             raise ValueError(f"Invalid symbol format: {symbol}")
         
         logger.debug("symbol_validated", symbol=symbol)
@@ -39,7 +43,13 @@ class InputValidator:
         
         exchange = exchange.strip().upper()
         
-        if not cls.EXCHANGE_PATTERN.match(exchange):
+        # Equivalent to ^[A-Z0-9_]{1,20}$; an all-underscore name is allowed
+        alnum = exchange.translate(_DROP_UNDERSCORE)
+        if not (
+            0 < len(exchange) <= cls.MAX_IDENTIFIER_LENGTH
+            and exchange.isascii()
+            and (not alnum or alnum.isalnum())
+        ):
             raise ValueError(f"Invalid exchange format: {exchange}")
         
         return exchange
@@ -91,5 +101,4 @@ class InputValidator:
             return ""
         
         # Remove control characters and limit length
-        sanitized = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', value)
-        return sanitized[:1000]
+        return value.translate(_CTRL_TABLE)[:1000]
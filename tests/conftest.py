@@ -0,0 +1,125 @@
+"""
+Shared test fixtures
+"""
+import asyncio
+
+import msgspec
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime
+
+from httpx import AsyncClient, ASGITransport
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from mcp_server.server import app
+from mcp_server.config import get_settings
+from mcp_server.schemas import QuoteData, DataSource
+from mcp_server.invoke_handlers import quote_latest as _ql, quote_stream as _qs
+
+
+# Request bodies are invariant, so test modules encode them once and post the bytes
+# with content=; the shared client sends this content type with every request
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Fixed timestamp keeps mocked quotes deterministic
+FIXED_TS = datetime(2024, 1, 1, 0, 0, 0)
+
+# Template for the mocked Finnhub quote; QuoteData is mutable and the handler
+# caches and updates what it gets, so each call returns a fresh copy
+_AAPL_QUOTE = QuoteData(
+    symbol="AAPL",
+    price=150.50,
+    timestamp=FIXED_TS,
+    data_source=DataSource.FINNHUB
+)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    One event loop for the whole session instead of one per test
+    pytest-asyncio 0.21 has no asyncio_default_fixture_loop_scope; overriding event_loop is its equivalent
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def client(event_loop):
+    """
+    Authenticated async test client calling the ASGI app directly on the session event loop
+    One warm-up GET pays the first-request cost before any test runs
+    """
+    c = AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        headers={"X-API-Key": get_settings().mcp_api_key, **JSON_HEADERS}
+    )
+    event_loop.run_until_complete(c.get("/health"))
+    
+    yield c
+    
+    event_loop.run_until_complete(c.aclose())
+
+
+@pytest.fixture(autouse=True)
+def restore_subscriptions():
+    """Undo any subscriptions a test registers so tests don't depend on run order"""
+    saved = dict(_qs._active_subscriptions)
+    yield
+    _qs._active_subscriptions.clear()
+    _qs._active_subscriptions.update(saved)
+    _qs._invalidate_subscriptions_view()
+
+
+def _make_connector_mock(**attrs) -> AsyncMock:
+    """
+    Build a connector mock from dotted attribute settings
+    Deliberately unspecced: spec/autospec introspects the real class on every build
+    """
+    return AsyncMock(**attrs)
+
+
+@pytest.fixture(scope="session")
+def binance_patch():
+    """
+    Mock the Binance connector behind quote.stream and /subscribe
+    Patched once for the session and shared by every test that subscribes
+    """
+    binance = _make_connector_mock(**{
+        "subscribe.return_value": "sub_12345678",
+        "unsubscribe.return_value": True
+    })
+    patcher = patch.object(_qs, "get_binance_connector", return_value=binance)
+    patcher.start()
+    
+    yield binance
+    
+    patcher.stop()
+
+
+@pytest.fixture(scope="session")
+def mock_connectors(binance_patch):
+    """
+    Mock Redis (disconnected), Finnhub and Binance for the invoke handlers
+    Built and patched once for the session; yields the mocks by name
+    """
+    finnhub = _make_connector_mock(**{
+        "get_quote.side_effect": lambda *_: msgspec.structs.replace(_AAPL_QUOTE)
+    })
+    
+    redis = MagicMock()
+    redis.get_snapshot_if_fresh_async = AsyncMock(side_effect=RedisConnectionError("Redis unavailable"))
+    
+    patchers = [
+        patch.object(_ql, "get_redis_client", return_value=redis),
+        patch.object(_ql, "get_finnhub_connector", return_value=finnhub),
+    ]
+    for patcher in patchers:
+        patcher.start()
+    
+    yield {"finnhub": finnhub, "binance": binance_patch, "redis": redis}
+    
+    for patcher in patchers:
+        patcher.stop()
@@ -1,17 +1,25 @@
 """
 Tests for Financial Data Connectors
 """
+import json
+import asyncio
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
+from tenacity import wait_none
 from datetime import datetime
 
 from connectors.alpha_vantage import AlphaVantageConnector
 from connectors.finnhub import FinnhubConnector
+from connectors import binance_ws
 from connectors.binance_ws import BinanceWebSocketConnector
 from mcp_server.schemas import QuoteData, StreamTick, DataSource
 
 
+# Fixed timestamp for schema construction; the tests don't depend on the time
+FIXED_TS = datetime(2024, 1, 1, 0, 0, 0)
+
+
 class TestAlphaVantageConnector:
     """Tests for Alpha Vantage connector"""
     
@@ -36,7 +44,7 @@ class TestAlphaVantageConnector:
         }
         
         with patch.object(connector._client, 'get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value.json.return_value = mock_response
+            mock_get.return_value.content = json.dumps(mock_response).encode()
             mock_get.return_value.raise_for_status = MagicMock()
             
             quote = await connector.get_quote("AAPL")
@@ -47,6 +55,28 @@ class TestAlphaVantageConnector:
             assert quote.data_source == DataSource.ALPHA_VANTAGE
             assert quote.volume == 1000000
     
+    @pytest.mark.asyncio
+    async def test_blank_fields_parsed_as_none(self, connector):
+        """Test blank numeric fields don't drop the quote"""
+        mock_response = {
+            "Global Quote": {
+                "01. symbol": "AAPL",
+                "02. open": "",
+                "05. price": "152.50",
+                "06. volume": ""
+            }
+        }
+        
+        with patch.object(connector._client, 'get', new_callable=AsyncMock) as mock_get:
+            mock_get.return_value.content = json.dumps(mock_response).encode()
+            mock_get.return_value.raise_for_status = MagicMock()
+            
+            quote = await connector.get_quote("AAPL")
+        
+        assert quote.price == 152.50
+        assert quote.volume is None
+        assert quote.open is None
+    
     @pytest.mark.asyncio
     async def test_rate_limit_handling(self, connector):
         """Test rate limit error handling"""
@@ -55,11 +85,16 @@ class TestAlphaVantageConnector:
         }
         
         with patch.object(connector._client, 'get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value.json.return_value = mock_response
+            mock_get.return_value.content = json.dumps(mock_response).encode()
             mock_get.return_value.raise_for_status = MagicMock()
             
-            with pytest.raises(Exception):  # Should raise RateLimitError
-                await connector.get_quote("AAPL")
+            # Retry immediately instead of sleeping through the backoff and the 12s call spacing
+            connector._min_interval = 0
+            with patch.object(connector.get_quote.retry, "wait", wait_none()):
+                with pytest.raises(Exception):  # Should raise RateLimitError
+                    await connector.get_quote("AAPL")
+            
+            assert mock_get.call_count == 3
     
     @pytest.mark.asyncio
     async def test_empty_response(self, connector):
@@ -67,7 +102,7 @@ class TestAlphaVantageConnector:
         mock_response = {"Global Quote": {}}
         
         with patch.object(connector._client, 'get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value.json.return_value = mock_response
+            mock_get.return_value.content = json.dumps(mock_response).encode()
             mock_get.return_value.raise_for_status = MagicMock()
             
             quote = await connector.get_quote("INVALID")
@@ -96,7 +131,7 @@ class TestFinnhubConnector:
         }
         
         with patch.object(connector._client, 'get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value.json.return_value = mock_response
+            mock_get.return_value.content = json.dumps(mock_response).encode()
             mock_get.return_value.status_code = 200
             mock_get.return_value.raise_for_status = MagicMock()
             
@@ -115,7 +150,7 @@ class TestFinnhubConnector:
         mock_response = {"c": 0, "h": 0, "l": 0, "o": 0, "pc": 0}
         
         with patch.object(connector._client, 'get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value.json.return_value = mock_response
+            mock_get.return_value.content = json.dumps(mock_response).encode()
             mock_get.return_value.status_code = 200
             mock_get.return_value.raise_for_status = MagicMock()
             
@@ -130,7 +165,7 @@ class TestBinanceConnector:
     @pytest.fixture
     def connector(self):
         """Create Binance connector"""
-        with patch("connectors.binance_ws.get_redis_client") as mock_redis:
+        with patch.object(binance_ws, "get_redis_client") as mock_redis:
             mock_redis.return_value = MagicMock()
             return BinanceWebSocketConnector()
     
@@ -146,13 +181,21 @@ class TestBinanceConnector:
         # Initially no subscriptions
         assert len(connector.get_active_subscriptions()) == 0
     
+    def test_put_latest_drops_oldest_when_full(self):
+        """Test a full tick queue drops its oldest tick to make room"""
+        queue = asyncio.Queue(maxsize=2)
+        for tick in ("t1", "t2", "t3"):
+            BinanceWebSocketConnector._put_latest(queue, tick)
+        
+        assert [queue.get_nowait() for _ in range(queue.qsize())] == ["t2", "t3"]
+    
     def test_tick_normalization(self):
         """Test tick data normalization"""
         tick = StreamTick(
             symbol="BTCUSDT",
             price=50000.0,
             volume=1.5,
-            timestamp=datetime.utcnow(),
+            timestamp=FIXED_TS,
             trade_id="123456",
             data_source=DataSource.BINANCE
         )
@@ -171,7 +214,7 @@ class TestConnectorNormalization:
         quote = QuoteData(
             symbol="TEST",
             price=100.0,
-            timestamp=datetime.utcnow(),
+            timestamp=FIXED_TS,
             data_source=DataSource.FINNHUB
         )
         
@@ -188,7 +231,7 @@ class TestConnectorNormalization:
             symbol="TEST",
             price=100.0,
             volume=10.0,
-            timestamp=datetime.utcnow()
+            timestamp=FIXED_TS
         )
         
         assert hasattr(tick, 'symbol')
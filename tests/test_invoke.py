@@ -0,0 +1,215 @@
+"""
+Tests for MCP Server /invoke endpoint
+"""
+import orjson
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timedelta
+
+from mcp_server.schemas import QuoteData, DataSource
+from mcp_server.invoke_handlers import handle_quote_latest
+from mcp_server.invoke_handlers import quote_latest as _ql
+
+
+_QUOTE_LATEST_PAYLOAD = orjson.dumps({
+    "tool_name": "quote.latest",
+    "arguments": {"symbol": "AAPL", "maxAgeSec": 60}
+})
+_QUOTE_STREAM_PAYLOAD = orjson.dumps({
+    "tool_name": "quote.stream",
+    "arguments": {"symbol": "BTCUSDT", "channel": "trades"}
+})
+_INVALID_SYMBOL_PAYLOAD = orjson.dumps({
+    "tool_name": "quote.latest",
+    "arguments": {"symbol": "INVALID-SYMBOL!!!"}
+})
+_MISSING_SYMBOL_PAYLOAD = orjson.dumps({
+    "tool_name": "quote.latest",
+    "arguments": {}
+})
+_UNKNOWN_TOOL_PAYLOAD = orjson.dumps({
+    "tool_name": "unknown.tool",
+    "arguments": {}
+})
+
+
+class TestInvokeValidSymbol:
+    """Tests for tool invocation with valid arguments"""
+    
+    @pytest.mark.parametrize("payload,symbol", [
+        (_QUOTE_LATEST_PAYLOAD, "AAPL"),
+        (_QUOTE_STREAM_PAYLOAD, "BTCUSDT"),
+    ], ids=["quote.latest", "quote.stream"])
+    @pytest.mark.asyncio
+    async def test_invoke_valid_symbol(self, client, mock_connectors, payload, symbol):
+        """Test each tool succeeds against its mocked connector"""
+        response = await client.post("/invoke", content=payload)
+        data = response.json()
+        
+        assert response.status_code == 200
+        assert data["success"] == True
+        assert data["data"]["symbol"] == symbol
+
+
+class TestInvokeQuoteLatest:
+    """Tests for quote.latest tool invocation"""
+    
+    @pytest.mark.parametrize("payload", [
+        _INVALID_SYMBOL_PAYLOAD,
+        _MISSING_SYMBOL_PAYLOAD,
+    ], ids=["invalid_symbol", "missing_symbol"])
+    @pytest.mark.asyncio
+    async def test_invoke_quote_latest_invalid(self, client, payload):
+        """Test quote.latest with invalid and missing symbols"""
+        response = await client.post("/invoke", content=payload)
+        data = response.json()
+        
+        assert data["success"] == False
+        assert data["error"]
+
+
+class TestQuoteLatestSemanticCache:
+    """Tests for the semantic cache lookup in quote.latest"""
+    
+    @pytest.mark.parametrize("symbol", ["", "   "], ids=["empty", "whitespace"])
+    @pytest.mark.asyncio
+    async def test_blank_symbol_skips_semantic_lookup(self, symbol):
+        """Test a blank symbol is rejected before an unfiltered semantic search"""
+        semantic_cache = MagicMock()
+        semantic_cache.search_similar_async = AsyncMock()
+        
+        with patch.object(_ql, "get_semantic_cache", return_value=semantic_cache):
+            response = await handle_quote_latest(symbol=symbol, query_text="price of apple")
+        
+        assert response.success == False
+        assert response.error == "Symbol cannot be empty"
+        semantic_cache.search_similar_async.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_semantic_lookup_uses_normalized_symbol(self):
+        """Test the semantic search is filtered on the stripped, upper-cased symbol"""
+        semantic_cache = MagicMock()
+        semantic_cache.search_similar_async = AsyncMock(return_value={
+            "symbol": "AAPL",
+            "response_text": '{"price": 150.5}'
+        })
+        
+        with patch.object(_ql, "get_semantic_cache", return_value=semantic_cache):
+            response = await handle_quote_latest(symbol=" aapl ", query_text="price of apple")
+        
+        assert response.success == True
+        assert response.data["price"] == 150.5
+        assert semantic_cache.search_similar_async.call_args.kwargs["symbol"] == "AAPL"
+
+
+class TestQuoteLatestLocalCache:
+    """Tests for the process-local snapshot cache in quote.latest"""
+    
+    @pytest.fixture(autouse=True)
+    def clear_local_cache(self):
+        """Start and finish each test with an empty local cache"""
+        _ql._local_snapshot_cache.clear()
+        yield
+        _ql._local_snapshot_cache.clear()
+    
+    @staticmethod
+    def _cache_quote(age_sec: int) -> None:
+        """Seed the local cache with an AAPL quote of the given age"""
+        _ql._local_snapshot_cache["AAPL"] = QuoteData(
+            symbol="AAPL",
+            price=151.25,
+            timestamp=datetime.utcnow() - timedelta(seconds=age_sec),
+            data_source=DataSource.FINNHUB
+        )
+    
+    @pytest.mark.asyncio
+    async def test_local_cache_hit_within_max_age(self, mock_connectors):
+        """Test a cached quote younger than maxAgeSec is served from the local cache"""
+        self._cache_quote(age_sec=5)
+        mock_connectors["finnhub"].get_quote.reset_mock()
+        
+        response = await handle_quote_latest(symbol="AAPL", max_age_sec=60)
+        
+        assert response.success == True
+        assert response.cache_hit == True
+        assert response.data_source == DataSource.LOCAL_CACHE.value
+        assert response.data["price"] == 151.25
+        mock_connectors["finnhub"].get_quote.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_local_cache_miss_when_stale(self, mock_connectors):
+        """Test a cached quote older than maxAgeSec falls through to the connectors"""
+        self._cache_quote(age_sec=120)
+        
+        response = await handle_quote_latest(symbol="AAPL", max_age_sec=60)
+        
+        assert response.success == True
+        assert response.cache_hit == False
+        assert response.data_source == DataSource.FINNHUB.value
+        assert response.data["price"] == 150.50
+
+
+class TestUnknownTool:
+    """Tests for unknown tool handling"""
+    
+    @pytest.mark.asyncio
+    async def test_invoke_unknown_tool(self, client):
+        """Test invoking unknown tool returns error"""
+        response = await client.post("/invoke", content=_UNKNOWN_TOOL_PAYLOAD)
+        data = response.json()
+        
+        assert response.status_code == 400
+        assert data["success"] == False
+        assert "Unknown tool" in data["error"]
+
+
+class TestMalformedBody:
+    """Tests for request bodies that aren't a well-formed tool invocation"""
+    
+    @pytest.mark.asyncio
+    async def test_invoke_malformed_json(self, client):
+        """Test a body that isn't valid JSON gets a readable error"""
+        response = await client.post("/invoke", content=b'{"tool_name": ')
+        data = response.json()
+        
+        assert response.status_code == 400
+        assert data["success"] == False
+        assert data["error"] == "Request body is not valid JSON"
+    
+    @pytest.mark.parametrize("body,error", [
+        (b'{"arguments": {}}', "tool_name is required"),
+        (b'{"tool_name": 123, "arguments": {}}', "tool_name must be a string"),
+        (b'{"tool_name": "", "arguments": {}}', "Tool name cannot be empty"),
+        (b'[1, 2]', "Request body must be a JSON object"),
+    ], ids=["missing_tool_name", "non_string_tool_name", "empty_tool_name", "non_object_body"])
+    @pytest.mark.asyncio
+    async def test_invoke_bad_tool_name(self, client, body, error):
+        """Test each way of omitting a usable tool_name gets its own error"""
+        response = await client.post("/invoke", content=body)
+        data = response.json()
+        
+        assert response.status_code == 400
+        assert data["success"] == False
+        assert data["error"] == error
+
+
+class TestCORSPreflight:
+    """Tests for CORS preflight handling"""
+    
+    @pytest.mark.asyncio
+    async def test_preflight_handled_by_cors_middleware(self, client):
+        """Test OPTIONS preflight is answered without a route"""
+        response = await client.options(
+            "/invoke",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST"
+            }
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert response.headers["access-control-max-age"] == "86400"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
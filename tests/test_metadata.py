@@ -0,0 +1,65 @@
+"""
+Tests for MCP Server metadata, capabilities and health endpoints
+"""
+import pytest
+
+
+@pytest.fixture(scope="session")
+def metadata_response(client, event_loop):
+    """/.well-known/mcp response, fetched once; the endpoint serves static JSON"""
+    return event_loop.run_until_complete(client.get("/.well-known/mcp"))
+
+
+@pytest.fixture(scope="session")
+def capabilities_response(client, event_loop):
+    """/capabilities response, fetched once; the endpoint serves static JSON"""
+    return event_loop.run_until_complete(client.get("/capabilities"))
+
+
+class TestMCPMetadata:
+    """Tests for /.well-known/mcp endpoint"""
+    
+    def test_metadata_endpoint(self, metadata_response):
+        """Test MCP metadata returns correct structure"""
+        assert metadata_response.status_code == 200
+        
+        data = metadata_response.json()
+        assert "name" in data
+        assert "version" in data
+        assert "protocol_version" in data
+        assert "endpoints" in data
+        assert data["endpoints"]["capabilities"] == "/capabilities"
+        assert data["endpoints"]["invoke"] == "/invoke"
+
+
+class TestCapabilities:
+    """Tests for /capabilities endpoint"""
+    
+    def test_capabilities_endpoint(self, capabilities_response):
+        """Test capabilities returns tools list"""
+        assert capabilities_response.status_code == 200
+        
+        data = capabilities_response.json()
+        assert "tools" in data
+        
+        tool_names = [t["name"] for t in data["tools"]]
+        assert "quote.latest" in tool_names
+        assert "quote.stream" in tool_names
+
+
+class TestHealthCheck:
+    """Tests for health endpoint"""
+    
+    @pytest.mark.asyncio
+    async def test_health_endpoint(self, client):
+        """Test health check returns status"""
+        response = await client.get("/health")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert "status" in data
+        assert data["status"] == "healthy"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
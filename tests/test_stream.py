@@ -0,0 +1,146 @@
+"""
+Tests for MCP Server /stream WebSocket endpoint
+"""
+import asyncio
+
+import ormsgpack
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from websockets.exceptions import ConnectionClosedOK
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from connectors.binance_ws import BinanceWebSocketConnector
+from mcp_server import server as _server
+from mcp_server.config import get_settings
+from mcp_server.server import app
+
+
+_AUTH_HEADERS = {"X-API-Key": get_settings().mcp_api_key}
+
+# Tick tuple as queued by the Binance connector: (symbol, price, volume, ts_ms, trade_id)
+_TICK = ("BTCUSDT", 50000.0, 1.5, 1704067200000, "123456")
+
+
+@pytest.fixture(scope="module")
+def ws_client():
+    """Sync test client for WebSocket routes; lifespan isn't started"""
+    return TestClient(app)
+
+
+def _queue_with(*items) -> asyncio.Queue:
+    """Tick queue pre-filled so the endpoint never has to wait on it"""
+    queue = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+    return queue
+
+
+class TestStreamAuth:
+    """Tests for /stream connection checks"""
+    
+    def test_missing_api_key_closes_with_policy_violation(self, ws_client):
+        """Test a connection without X-API-Key is closed with 1008"""
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with ws_client.websocket_connect("/stream/sub_12345678"):
+                pass
+        
+        assert exc_info.value.code == 1008
+    
+    def test_unknown_subscription_closes_with_policy_violation(self, ws_client):
+        """Test a connection for an unknown subscription is closed with 1008"""
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with ws_client.websocket_connect("/stream/unknown_sub_id", headers=_AUTH_HEADERS):
+                pass
+        
+        assert exc_info.value.code == 1008
+
+
+class TestStreamFrames:
+    """Tests for /stream frame delivery"""
+    
+    def test_ticks_sent_as_msgpack_frames(self, ws_client):
+        """Test each queued tick arrives as one msgpack array frame"""
+        second = ("BTCUSDT", 50001.0, 0.5, 1704067201000, "123457")
+        queue = _queue_with(_TICK, second, None)
+        
+        with patch.object(_server, "get_tick_queue", return_value=queue):
+            with ws_client.websocket_connect("/stream/sub_12345678", headers=_AUTH_HEADERS) as ws:
+                frames = [ormsgpack.unpackb(ws.receive_bytes()) for _ in range(2)]
+        
+        assert frames == [list(_TICK), list(second)]
+    
+    def test_sentinel_closes_socket(self, ws_client):
+        """Test the None sentinel from unsubscribe closes the socket normally"""
+        queue = _queue_with(_TICK, None)
+        
+        with patch.object(_server, "get_tick_queue", return_value=queue):
+            with ws_client.websocket_connect("/stream/sub_12345678", headers=_AUTH_HEADERS) as ws:
+                ws.receive_bytes()
+                
+                with pytest.raises(WebSocketDisconnect) as exc_info:
+                    ws.receive_bytes()
+        
+        assert exc_info.value.code == 1000
+    
+    def test_sentinel_kept_when_queue_full(self, ws_client):
+        """Test unsubscribing on a full queue drops the oldest tick, not the sentinel"""
+        newer = ("BTCUSDT", 50001.0, 0.5, 1704067201000, "123457")
+        queue = asyncio.Queue(maxsize=2)
+        for item in (_TICK, newer, None):
+            BinanceWebSocketConnector._put_latest(queue, item)
+        
+        with patch.object(_server, "get_tick_queue", return_value=queue):
+            with ws_client.websocket_connect("/stream/sub_12345678", headers=_AUTH_HEADERS) as ws:
+                frame = ormsgpack.unpackb(ws.receive_bytes())
+                
+                with pytest.raises(WebSocketDisconnect) as exc_info:
+                    ws.receive_bytes()
+        
+        assert frame == list(newer)
+        assert exc_info.value.code == 1000
+
+
+
+class TestStreamDisconnect:
+    """Tests for /stream clean-up when the client goes away"""
+    
+    @pytest.mark.asyncio
+    async def test_client_disconnect_mid_stream_ends_handler(self):
+        """Test the handler returns when the client leaves while the queue is quiet"""
+        sent = asyncio.Event()
+        
+        async def receive():
+            await sent.wait()
+            return {"type": "websocket.disconnect", "code": 1000}
+        
+        websocket = MagicMock()
+        websocket.headers = _AUTH_HEADERS
+        websocket.accept = AsyncMock()
+        websocket.receive = receive
+        websocket.send_bytes = AsyncMock(side_effect=lambda _: sent.set())
+        
+        # One tick and no sentinel: only the disconnect can end the stream
+        with patch.object(_server, "get_tick_queue", return_value=_queue_with(_TICK)):
+            await asyncio.wait_for(_server.stream_ticks(websocket, "sub_12345678"), timeout=1)
+        
+        websocket.send_bytes.assert_awaited_once()
+        websocket.close.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_closed_connection_on_send_is_handled(self):
+        """Test a send on a connection the server already saw close ends the stream quietly"""
+        websocket = MagicMock()
+        websocket.headers = _AUTH_HEADERS
+        websocket.accept = AsyncMock()
+        websocket.receive = AsyncMock(side_effect=asyncio.Event().wait)
+        websocket.send_bytes = AsyncMock(side_effect=ConnectionClosedOK(None, None))
+        
+        with patch.object(_server, "get_tick_queue", return_value=_queue_with(_TICK)):
+            await _server.stream_ticks(websocket, "sub_12345678")
+        
+        websocket.send_bytes.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,89 @@
+"""
+Tests for MCP Server subscription management
+"""
+import orjson
+import pytest
+
+from mcp_server.invoke_handlers import handle_quote_stream, handle_unsubscribe, get_active_subscriptions
+
+
+_SUBSCRIBE_PAYLOAD = orjson.dumps({
+    "symbol": "BTCUSDT",
+    "channel": "trades"
+})
+_UNSUBSCRIBE_PAYLOAD = orjson.dumps({"subscription_id": "sub_12345678"})
+_UNSUBSCRIBE_UNKNOWN_PAYLOAD = orjson.dumps({"subscription_id": "unknown_sub_id"})
+
+
+class TestSubscriptionEndpoints:
+    """Tests for subscription management"""
+    
+    @pytest.mark.asyncio
+    async def test_subscribe_endpoint(self, client, binance_patch):
+        """Test subscribe endpoint against the mocked Binance connector"""
+        response = await client.post("/subscribe", content=_SUBSCRIBE_PAYLOAD)
+        data = response.json()
+        
+        assert response.status_code == 200
+        assert data["success"] == True
+        assert data["data"]["subscription_id"] == "sub_12345678"
+    
+    @pytest.mark.asyncio
+    async def test_unsubscribe_endpoint(self, client, binance_patch):
+        """Test unsubscribe endpoint removes a subscription"""
+        await handle_quote_stream(symbol="BTCUSDT")
+        
+        response = await client.post("/unsubscribe", content=_UNSUBSCRIBE_PAYLOAD)
+        data = response.json()
+        
+        assert response.status_code == 200
+        assert data["success"] == True
+        assert data["data"]["status"] == "unsubscribed"
+    
+    @pytest.mark.asyncio
+    async def test_unsubscribe_endpoint_unknown_subscription(self, client):
+        """Test unsubscribe endpoint rejects an unknown subscription"""
+        response = await client.post("/unsubscribe", content=_UNSUBSCRIBE_UNKNOWN_PAYLOAD)
+        data = response.json()
+        
+        assert response.status_code == 400
+        assert data["success"] == False
+        assert "Unknown subscription" in data["error"]
+    
+    @pytest.mark.asyncio
+    async def test_list_subscriptions_endpoint(self, client):
+        """Test subscriptions endpoint returns the registry"""
+        response = await client.get("/subscriptions")
+        
+        assert response.status_code == 200
+        assert isinstance(response.json()["subscriptions"], dict)
+    
+    @pytest.mark.asyncio
+    async def test_unsubscribe_unknown_subscription(self):
+        """Test unsubscribe with unknown subscription"""
+        response = await handle_unsubscribe("unknown_sub_id")
+        
+        assert response.success == False
+        assert response.error
+    
+    @pytest.mark.asyncio
+    async def test_list_subscriptions(self, binance_patch):
+        """Test the listed registry tracks subscribe and unsubscribe"""
+        # Read first so the cached view has to be invalidated by each change
+        assert "sub_12345678" not in get_active_subscriptions()
+        
+        await handle_quote_stream(symbol="BTCUSDT", channel="trades", agent_id=None)
+        
+        assert get_active_subscriptions()["sub_12345678"] == {
+            "symbol": "BTCUSDT",
+            "channel": "trades",
+            "agent_id": None
+        }
+        
+        await handle_unsubscribe("sub_12345678")
+        
+        assert "sub_12345678" not in get_active_subscriptions()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])